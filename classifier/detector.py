@@ -4,7 +4,7 @@ Unified AI Image Detection Pipeline
 Orchestrates all detection components into a single cohesive pipeline.
 """
 
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, Union
 import logging
 import os
 
@@ -18,10 +18,20 @@ from multi_frame_analyzer import MultiFrameAnalyzer
 from gemini_analyzer import GeminiAnalyzer
 from models import DetectionResult
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 import io
 
 logger = logging.getLogger(__name__)
 
+# Pool for decoding multi-frame batches; Pillow releases the GIL while decoding,
+# so threads decode in parallel without pickling frames to worker processes
+decode_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="frame-decode")
+
+
+def _decode_frame(image_bytes: bytes) -> Image.Image:
+    """Decode raw image bytes into an RGB PIL Image."""
+    return Image.open(io.BytesIO(image_bytes)).convert("RGB")
+
 class AIImageDetector:
     """
     Unified AI image detector that combines ML classification, visual analysis,
@@ -67,6 +77,17 @@ class AIImageDetector:
         
         logger.info("AI Image Detector initialized successfully")
     
+    def warmup(self) -> None:
+        """
+        Warm up the ML classifier before serving traffic.
+        
+        Only the local model is exercised; the Gemini client is already constructed
+        in __init__ and a warmup request would cost a real API call.
+        """
+        logger.info("Warming up classifier...")
+        self.classifier.warmup()
+        logger.info("Classifier warmup complete")
+    
     def analyze(self, image_bytes: Union[bytes, List[bytes]]) -> DetectionResult:
         """
         Complete detection pipeline for TikTok screenshot analysis.
@@ -106,12 +127,110 @@ class AIImageDetector:
         
         # Single frame processing (original logic)
         # Convert bytes to PIL Image (reused across stages)
-        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+        image = _decode_frame(image_bytes)
+        
+        return self._analyze_image(image_bytes, image)
+    
+    def analyze_batch(self, image_bytes_list: List[bytes]) -> List[DetectionResult]:
+        """
+        Run the detection pipeline on several frames with batched classification.
+        
+        All frames are decoded up front, classified in a single model forward pass and
+        visually analyzed concurrently; the remaining per-frame stages then run on
+        each frame as in analyze().
+        Frames that fail to decode or process are logged and skipped.
         
+        Args:
+            image_bytes_list: List of raw image bytes (one per frame)
+        
+        Returns:
+            List of DetectionResult for the frames that processed successfully, in input order
+        """
+        # Decode all frames up front, concurrently
+        futures = [decode_executor.submit(_decode_frame, image_bytes) for image_bytes in image_bytes_list]
+        decoded = []
+        for i, (image_bytes, future) in enumerate(zip(image_bytes_list, futures)):
+            try:
+                decoded.append((i, image_bytes, future.result()))
+            except Exception as e:
+                logger.warning(f"Frame {i+1}/{len(image_bytes_list)} could not be decoded: {str(e)}")
+        
+        if not decoded:
+            return []
+        
+        # Step 1 for all frames: one batched SDXL forward pass
+        logger.debug(f"Running SDXL classifier on {len(decoded)} frames in one batch...")
+        try:
+            classifier_results = self.classifier.predict_batch([image for _, _, image in decoded])
+        except Exception as e:
+            logger.error(f"Batched classifier failed: {str(e)}", exc_info=True)
+            raise Exception(f"Image classification failed: {str(e)}")
+        
+        # Screenshot quality for all frames; on failure each frame falls back to
+        # its own analysis (and defaults) in _analyze_image
+        try:
+            screenshot_results = self.screenshot_analyzer.analyze_batch([image for _, _, image in decoded])
+        except Exception as e:
+            logger.warning(f"Batched screenshot analysis failed: {str(e)}", exc_info=True)
+            screenshot_results = [None] * len(decoded)
+        
+        # Visual analysis (faces, OCR, metadata) for all frames concurrently; frames
+        # without a result are analyzed again in _analyze_image
+        try:
+            visual_results = self.visual_analyzer.analyze_batch([image for _, _, image in decoded])
+        except Exception as e:
+            logger.warning(f"Batched visual analysis failed: {str(e)}", exc_info=True)
+            visual_results = [None] * len(decoded)
+        
+        # Remaining stages per frame
+        results = []
+        for (i, image_bytes, image), classifier_result, screenshot_result, visual_result in zip(
+            decoded, classifier_results, screenshot_results, visual_results
+        ):
+            try:
+                result = self._analyze_image(
+                    image_bytes, image,
+                    classifier_result=classifier_result,
+                    screenshot_result=screenshot_result,
+                    visual_features=visual_result
+                )
+                results.append(result)
+                logger.debug(f"Frame {i+1}/{len(image_bytes_list)}: severity={result.severity}, "
+                             f"confidence={result.confidence:.4f}")
+            except Exception as e:
+                logger.warning(f"Frame {i+1}/{len(image_bytes_list)} processing failed: {str(e)}", exc_info=True)
+        
+        return results
+    
+    def _analyze_image(
+        self,
+        image_bytes: bytes,
+        image: Image.Image,
+        classifier_result: Optional[Dict[str, Any]] = None,
+        screenshot_result: Optional[Dict[str, Any]] = None,
+        visual_features: Optional[Dict[str, Any]] = None
+    ) -> DetectionResult:
+        """
+        Run the single-frame pipeline on an already decoded image.
+        
+        Args:
+            image_bytes: Raw image bytes (sent to Gemini and the classifier)
+            image: Decoded PIL Image (RGB format)
+            classifier_result: Precomputed Classifier output (e.g. from a batched pass);
+                if None, the classifier runs on image_bytes
+            screenshot_result: Precomputed ScreenshotAnalyzer output (e.g. from a
+                batched pass); if None, screenshot analysis runs on image
+            visual_features: Precomputed VisualAnalyzer output (e.g. from a batched
+                pass); if None, visual analysis runs on image
+        
+        Returns:
+            DetectionResult with complete analysis
+        """
         # Step 0: Screenshot Quality Analysis (mandatory first stage)
         logger.debug("Analyzing screenshot quality...")
         try:
-            screenshot_result = self.screenshot_analyzer.analyze(image)
+            if screenshot_result is None:
+                screenshot_result = self.screenshot_analyzer.analyze(image)
             signal_confidence = screenshot_result.get("signal_confidence", 0.7)
             screenshot_confidence = screenshot_result.get("screenshot_confidence", 1.0)
             logger.debug(f"Screenshot analysis: signal_confidence={signal_confidence:.4f}")
@@ -129,7 +248,8 @@ class AIImageDetector:
         # Step 1: SDXL Aesthetic Similarity Classification
         logger.debug("Running SDXL classifier (aesthetic similarity)...")
         try:
-            classifier_result = self.classifier.predict(image_bytes)
+            if classifier_result is None:
+                classifier_result = self.classifier.predict(image_bytes)
             aesthetic_similarity_score = classifier_result.get("aesthetic_similarity_score", 0.0)
             logger.debug(f"Aesthetic similarity: {aesthetic_similarity_score:.4f}")
         except Exception as e:
@@ -177,7 +297,8 @@ class AIImageDetector:
         # Step 2: Visual Analysis (improved OCR + semantic errors)
         logger.debug("Running visual analysis...")
         try:
-            visual_features = self.visual_analyzer.analyze(image)
+            if visual_features is None:
+                visual_features = self.visual_analyzer.analyze(image)
             ocr_confidence = visual_features.get("text", {}).get("ocr_confidence", 0.5)
             logger.debug(f"Visual analysis: {visual_features['faces']['face_count']} face(s), "
                         f"{visual_features['text']['word_count']} words, OCR confidence={ocr_confidence:.4f}")
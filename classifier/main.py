@@ -1,22 +1,29 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException, Path, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, File, UploadFile, HTTPException, Path, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from detector import AIImageDetector
 from models import DetectionResult
-from gemini_analyzer import GeminiAnalyzer
 from lesson_generator import LessonGenerator
+import asyncio
 import logging
 import os
-import glob
 import base64
-import json
-from typing import Dict, List, Optional, Tuple, Set
+import hashlib
+import orjson
+import msgpack
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Optional, Tuple, Set
 from dotenv import load_dotenv
-import os
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Read once at import; the environment is not expected to change at runtime
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,7 +32,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="AI Image Detection System",
     description="Comprehensive AI image detection with severity scoring and educational explanations",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for web client integration
@@ -42,6 +50,9 @@ logger.info("Initializing AI Image Detector...")
 detector = AIImageDetector()
 logger.info("AI Image Detector ready")
 
+# Single worker: inference runs off the event loop, but GPU access stays serialized
+detector_executor = ThreadPoolExecutor(max_workers=1)
+
 # Initialize LessonGenerator for educational content (lazy initialization)
 lesson_generator: Optional[LessonGenerator] = None
 
@@ -49,27 +60,238 @@ def get_lesson_generator() -> LessonGenerator:
     """Get or initialize the LessonGenerator with Gemini API."""
     global lesson_generator
     if lesson_generator is None:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
+        if not GEMINI_API_KEY:
             raise HTTPException(
                 status_code=500,
                 detail="GEMINI_API_KEY environment variable not set"
             )
-        lesson_generator = LessonGenerator(api_key=api_key)
+        lesson_generator = LessonGenerator(api_key=GEMINI_API_KEY)
         logger.info("LessonGenerator initialized")
     return lesson_generator
 
+@app.on_event("startup")
+async def warmup():
+    """Warm up the detector and pre-build the LessonGenerator before serving traffic."""
+    detector.warmup()
+    if GEMINI_API_KEY:
+        get_lesson_generator()
+
 # Screenshots directory (relative to classifier folder)
 SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'screenshots')
 
-# In-memory storage for analysis results
-# Key: analysis_id (string), Value: Tuple[DetectionResult, bytes] (result and original image bytes)
-analysis_results: Dict[str, Tuple[DetectionResult, bytes]] = {}
+# Optional msgpack snapshot of stored analyses, restored on startup and written on
+# shutdown so a process restart does not lose them
+ANALYSES_SNAPSHOT_PATH = os.getenv("ANALYSES_SNAPSHOT_PATH")
+
+# Uploads larger than this are rejected with 413 while they are being read
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Bounds for stored analyses: total retained bytes and time-to-live per entry
+ANALYSIS_CACHE_MAX_BYTES = 512 * 1024 * 1024
+ANALYSIS_TTL_SECONDS = 60 * 60
+
+
+def analysis_entry_size(entry: Tuple[DetectionResult, bytes, str]) -> int:
+    """Approximate retained size of a stored analysis (its serialized JSON body)."""
+    return len(entry[1])
+
+
+# In-memory storage for analysis results, evicted by LRU order once the byte budget
+# is exceeded and expired after ANALYSIS_TTL_SECONDS. Only touched from the event loop.
+# Upload bytes are dropped after inference; frames are served from SCREENSHOTS_DIR.
+# Key: analysis_id (string), Value: Tuple[DetectionResult, bytes, str]
+# (result, serialized JSON body, ETag of the body)
+analysis_results: TTLCache = TTLCache(
+    maxsize=ANALYSIS_CACHE_MAX_BYTES,
+    ttl=ANALYSIS_TTL_SECONDS,
+    getsizeof=analysis_entry_size
+)
+
+# Frames on disk per analysis, reused by /image and /educate until the screenshots
+# directory changes (the watcher may still be writing frames after the POST).
+# Key: analysis_id (string), Value: Tuple[int, List[str], List[str]]
+# (directory mtime in ns, all frame paths sorted by name, frames selected for education)
+frame_index: LRUCache = LRUCache(maxsize=1024)
+
+# Frames skipped at the start of a capture (often taken during scroll transition)
+# and number of evenly spaced frames sent to Gemini
+EDUCATION_START_OFFSET = 2
+EDUCATION_MAX_FRAMES = 5
 
 # WebSocket connections for pushing results
 # Key: analysis_id (string), Value: Set of WebSocket connections
 active_connections: Dict[str, Set[WebSocket]] = {}
 
+# Per-analysis locks guarding mutation and snapshotting of active_connections
+connection_locks: DefaultDict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def remove_connections(analysis_id: str, websockets: Iterable[WebSocket]) -> None:
+    """Remove WebSocket connections for an analysis, cleaning up empty sets and locks."""
+    async with connection_locks[analysis_id]:
+        connections = active_connections.get(analysis_id)
+        if connections is not None:
+            connections.difference_update(websockets)
+            if not connections:
+                del active_connections[analysis_id]
+    if analysis_id not in active_connections:
+        connection_locks.pop(analysis_id, None)
+
+def store_analysis(analysis_id: str, detection_result: DetectionResult) -> bytes:
+    """
+    Store an analysis result together with its serialized JSON body and ETag.
+    
+    The result is not mutated after storage, so the JSON body is encoded once here
+    and served as-is on every subsequent GET and WebSocket push.
+    
+    Returns:
+        The serialized JSON body
+    """
+    body = orjson.dumps(detection_result.to_dict())
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    analysis_results[analysis_id] = (detection_result, body, etag)
+    return body
+
+
+def save_analyses(path: str) -> None:
+    """
+    Write all stored analyses to a msgpack snapshot.
+    
+    The file is replaced atomically so a crash mid-write leaves the previous
+    snapshot intact.
+    
+    Args:
+        path: Snapshot file path
+    """
+    snapshot = {
+        analysis_id: asdict(detection_result)
+        for analysis_id, (detection_result, _, _) in analysis_results.items()
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(msgpack.packb(snapshot, use_bin_type=True))
+    os.replace(tmp_path, path)
+    logger.info("Saved %s analyses to %s", len(snapshot), path)
+
+
+def load_analyses(path: str) -> None:
+    """
+    Restore analyses from a msgpack snapshot written by save_analyses().
+    
+    Args:
+        path: Snapshot file path
+    """
+    with open(path, 'rb') as f:
+        snapshot = msgpack.unpackb(f.read(), raw=False)
+    
+    for analysis_id, result_fields in snapshot.items():
+        store_analysis(analysis_id, DetectionResult(**result_fields))
+    
+    logger.info("Restored %s analyses from %s", len(snapshot), path)
+
+
+@app.on_event("startup")
+async def restore_analyses():
+    """Restore stored analyses from the snapshot, if one is configured."""
+    if ANALYSES_SNAPSHOT_PATH and os.path.exists(ANALYSES_SNAPSHOT_PATH):
+        try:
+            load_analyses(ANALYSES_SNAPSHOT_PATH)
+        except Exception as e:
+            logger.warning("Failed to restore analyses from %s: %s", ANALYSES_SNAPSHOT_PATH, e)
+
+
+@app.on_event("shutdown")
+async def snapshot_analyses():
+    """Write stored analyses to the snapshot, if one is configured."""
+    if ANALYSES_SNAPSHOT_PATH:
+        try:
+            save_analyses(ANALYSES_SNAPSHOT_PATH)
+        except Exception as e:
+            logger.warning("Failed to save analyses to %s: %s", ANALYSES_SNAPSHOT_PATH, e)
+
+
+def select_education_frames(frame_files: List[str]) -> List[str]:
+    """Skip the leading transition frames and pick up to 5 evenly spaced frames."""
+    if len(frame_files) > EDUCATION_START_OFFSET:
+        frame_files = frame_files[EDUCATION_START_OFFSET:]
+    
+    if len(frame_files) > EDUCATION_MAX_FRAMES:
+        step = len(frame_files) // EDUCATION_MAX_FRAMES
+        frame_files = [frame_files[i * step] for i in range(EDUCATION_MAX_FRAMES)]
+    
+    return frame_files
+
+
+def get_frames(analysis_id: str) -> Tuple[List[str], List[str]]:
+    """
+    Return the frames captured for an analysis.
+    
+    The screenshots directory is rescanned only when its mtime has changed since
+    the cached listing, so frames written after the first lookup are picked up.
+    
+    Returns:
+        Tuple of (all frame paths sorted by name, frames selected for education)
+    """
+    try:
+        dir_mtime = os.stat(SCREENSHOTS_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return [], []
+    
+    cached = frame_index.get(analysis_id)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1], cached[2]
+    
+    prefix = f"{analysis_id}_"
+    try:
+        with os.scandir(SCREENSHOTS_DIR) as entries:
+            frame_files = sorted(
+                entry.path for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(".jpg")
+            )
+    except FileNotFoundError:
+        return [], []
+    
+    education_frames = select_education_frames(frame_files)
+    frame_index[analysis_id] = (dir_mtime, frame_files, education_frames)
+    return frame_files, education_frames
+
+
+async def read_upload(file: UploadFile, index: int) -> bytes:
+    """
+    Read an uploaded file in chunks, rejecting it as soon as it exceeds MAX_IMAGE_BYTES.
+    
+    Args:
+        file: Uploaded file
+        index: Zero-based position of the file in the request (for error messages)
+    
+    Returns:
+        The file contents
+    
+    Raises:
+        HTTPException: 413 if the file is too large, 400 if it is empty
+    """
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > MAX_IMAGE_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File {index+1} exceeds the maximum size of {MAX_IMAGE_BYTES} bytes"
+            )
+    if not buffer:
+        raise HTTPException(status_code=400, detail=f"Empty file uploaded: file {index+1}")
+    return bytes(buffer)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header value matches the given ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -95,28 +317,28 @@ async def websocket_analysis(websocket: WebSocket, analysis_id: str):
     WebSocket endpoint for receiving push notifications when analysis completes.
     
     Clients connect to this endpoint to receive real-time updates when analysis
-    results are ready. The server will push the result as soon as it's available.
+    results are ready. The server will push the result as soon as it's available,
+    as a JSON text frame.
     
     Args:
         websocket: WebSocket connection
         analysis_id: Unique identifier for the analysis (path parameter)
     """
     await websocket.accept()
-    logger.info(f"WebSocket client connected for analysis_id: {analysis_id}")
+    logger.info("WebSocket client connected for analysis_id: %s", analysis_id)
     
     # Add connection to active connections set
-    if analysis_id not in active_connections:
-        active_connections[analysis_id] = set()
-    active_connections[analysis_id].add(websocket)
+    async with connection_locks[analysis_id]:
+        active_connections.setdefault(analysis_id, set()).add(websocket)
     
     # If result already exists, send it immediately
     if analysis_id in analysis_results:
-        detection_result, _ = analysis_results[analysis_id]
+        _, body, _ = analysis_results[analysis_id]
         try:
-            await websocket.send_json(detection_result.to_dict())
-            logger.info(f"Sent existing result to WebSocket client for {analysis_id}")
+            await websocket.send_text(body.decode())
+            logger.info("Sent existing result to WebSocket client for %s", analysis_id)
         except Exception as e:
-            logger.error(f"Error sending existing result to WebSocket: {e}")
+            logger.error("Error sending existing result to WebSocket: %s", e)
     
     try:
         # Keep connection alive and wait for disconnect
@@ -127,47 +349,47 @@ async def websocket_analysis(websocket: WebSocket, analysis_id: str):
             if data == "ping":
                 await websocket.send_text("pong")
     except WebSocketDisconnect:
-        logger.info(f"WebSocket client disconnected for analysis_id: {analysis_id}")
+        logger.info("WebSocket client disconnected for analysis_id: %s", analysis_id)
     except Exception as e:
-        logger.error(f"WebSocket error for {analysis_id}: {e}")
+        logger.error("WebSocket error for %s: %s", analysis_id, e)
     finally:
         # Remove connection from active connections
-        if analysis_id in active_connections:
-            active_connections[analysis_id].discard(websocket)
-            # Clean up empty sets
-            if not active_connections[analysis_id]:
-                del active_connections[analysis_id]
+        await remove_connections(analysis_id, (websocket,))
 
 
-async def push_result(analysis_id: str, result: DetectionResult):
+async def push_result(analysis_id: str, body: bytes):
     """
     Push analysis result to all connected WebSocket clients for this analysis_id.
     
     Args:
         analysis_id: Unique identifier for the analysis
-        result: DetectionResult to push to clients
+        body: Serialized DetectionResult JSON, as cached by store_analysis()
     """
     if analysis_id not in active_connections:
         return
     
-    result_dict = result.to_dict()
-    disconnected = set()
+    # Snapshot the connections under the lock, then send outside it to all clients
+    # concurrently, so one slow client does not hold up the rest
+    async with connection_locks[analysis_id]:
+        websockets = tuple(active_connections.get(analysis_id, ()))
+    # Sent as text frames, so clients can JSON.parse(event.data) directly
+    text = body.decode()
+    send_results = await asyncio.gather(
+        *(websocket.send_text(text) for websocket in websockets),
+        return_exceptions=True
+    )
     
-    for websocket in active_connections[analysis_id]:
-        try:
-            await websocket.send_json(result_dict)
-            logger.info(f"Pushed result to WebSocket client for {analysis_id}")
-        except Exception as e:
-            logger.warning(f"Error pushing result to WebSocket: {e}")
+    disconnected = set()
+    for websocket, send_result in zip(websockets, send_results):
+        if isinstance(send_result, Exception):
+            logger.warning("Error pushing result to WebSocket: %s", send_result)
             disconnected.add(websocket)
+        else:
+            logger.info("Pushed result to WebSocket client for %s", analysis_id)
     
     # Remove disconnected connections
-    for ws in disconnected:
-        active_connections[analysis_id].discard(ws)
-    
-    # Clean up empty sets
-    if analysis_id in active_connections and not active_connections[analysis_id]:
-        del active_connections[analysis_id]
+    if disconnected:
+        await remove_connections(analysis_id, disconnected)
 
 
 @app.post("/analyze/{analysis_id}")
@@ -210,39 +432,39 @@ async def analyze_image(
     
     # Check if analysis_id already exists
     if analysis_id in analysis_results:
-        logger.warning(f"Analysis ID {analysis_id} already exists, overwriting...")
+        logger.warning("Analysis ID %s already exists, overwriting...", analysis_id)
     
     try:
-        # Read all image bytes
-        image_bytes_list = []
-        for i, file in enumerate(files):
-            image_bytes = await file.read()
-            if len(image_bytes) == 0:
-                raise HTTPException(status_code=400, detail=f"Empty file uploaded: file {i+1}")
-            image_bytes_list.append(image_bytes)
+        # Read the single frame (size-capped while streaming)
+        image_bytes = await read_upload(files[0], 0)
         
-        # Run complete detection pipeline (handles both single and multi-frame)
-        detection_result = detector.analyze(image_bytes_list)
+        # Run complete detection pipeline
+        loop = asyncio.get_running_loop()
+        detection_result = await loop.run_in_executor(
+            detector_executor, detector.analyze, image_bytes
+        )
         
-        # Store result and original image bytes in memory
-        image_bytes = image_bytes_list[0]  # Store the single image
-        analysis_results[analysis_id] = (detection_result, image_bytes)
+        # Store result; the upload bytes are dropped after inference
+        del image_bytes
+        body = store_analysis(analysis_id, detection_result)
+        frame_index.pop(analysis_id, None)
         
-        logger.info(f"Analysis stored with ID {analysis_id}: {detection_result.severity} severity "
-                   f"({'AI' if detection_result.is_ai else 'Human'}, "
-                   f"{detection_result.confidence:.0%} confidence)")
+        logger.info("Analysis stored with ID %s: %s severity (%s, %.0f%% confidence)",
+                    analysis_id, detection_result.severity,
+                    'AI' if detection_result.is_ai else 'Human',
+                    detection_result.confidence * 100)
         
         # Push result to connected WebSocket clients
-        await push_result(analysis_id, detection_result)
+        await push_result(analysis_id, body)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "status": "success",
             "analysis_id": analysis_id,
             "message": "Analysis stored successfully"
         })
         
     except Exception as e:
-        logger.error(f"Error processing images: {str(e)}", exc_info=True)
+        logger.error("Error processing images: %s", e, exc_info=True)
         
         if isinstance(e, HTTPException):
             raise e
@@ -254,11 +476,18 @@ async def analyze_image(
 
 
 @app.get("/analyze/{analysis_id}")
-async def get_analysis(analysis_id: str = Path(..., description="Unique identifier for the analysis")):
+async def get_analysis(
+    request: Request,
+    analysis_id: str = Path(..., description="Unique identifier for the analysis")
+):
     """
     Retrieve a stored analysis result by ID.
     
+    The response carries an ETag; clients polling with If-None-Match receive
+    304 Not Modified without the body being re-sent.
+    
     Args:
+        request: Incoming request (used for the If-None-Match header)
         analysis_id: Unique identifier for the analysis (path parameter)
     
     Returns:
@@ -281,11 +510,65 @@ async def get_analysis(analysis_id: str = Path(..., description="Unique identifi
             detail=f"Analysis with ID '{analysis_id}' not found"
         )
     
-    detection_result, _ = analysis_results[analysis_id]
+    _, body, etag = analysis_results[analysis_id]
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    logger.info("Retrieved analysis with ID %s", analysis_id)
+    
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/analyze/{analysis_id}/image")
+async def get_analysis_image(analysis_id: str = Path(..., description="Unique identifier for the analysis")):
+    """
+    Return the first captured frame for a stored analysis.
+    
+    The frame is served straight from the screenshots directory with FileResponse,
+    which streams it via sendfile instead of loading it into memory. JPEG bytes
+    are already compressed, so no content encoding is applied.
+    
+    Args:
+        analysis_id: Unique identifier for the analysis (path parameter)
+    
+    Raises:
+        404: If the analysis_id doesn't exist or no frame is on disk for it
+    """
+    if analysis_id not in analysis_results:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Analysis with ID '{analysis_id}' not found"
+        )
+    
+    frame_files, _ = get_frames(analysis_id)
+    if not frame_files:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No frames found for analysis '{analysis_id}'"
+        )
+    
+    return FileResponse(frame_files[0], media_type="image/jpeg")
+
+
+def read_frame(frame_path: str) -> Optional[Tuple[bytes, str]]:
+    """
+    Read one frame file and base64-encode it (blocking; run in an executor).
     
-    logger.info(f"Retrieved analysis with ID {analysis_id}")
+    Args:
+        frame_path: Path of the frame to read
     
-    return JSONResponse(content=detection_result.to_dict())
+    Returns:
+        Tuple of (raw frame bytes, base64-encoded frame), or None if unreadable
+    """
+    try:
+        with open(frame_path, 'rb') as f:
+            frame_data = f.read()
+    except Exception as e:
+        logger.warning("Failed to read frame %s: %s", frame_path, e)
+        return None
+    
+    return frame_data, base64.b64encode(frame_data).decode('ascii')
 
 
 @app.get("/educate/{analysis_id}")
@@ -323,42 +606,24 @@ async def get_education(analysis_id: str = Path(..., description="Unique identif
             detail=f"Analysis with ID '{analysis_id}' not found"
         )
     
-    detection_result, _ = analysis_results[analysis_id]
+    detection_result, _, _ = analysis_results[analysis_id]
     
     try:
         # Find frames for this post in screenshots directory
-        frame_pattern = os.path.join(SCREENSHOTS_DIR, f"{analysis_id}_*.jpg")
-        frame_files = sorted(glob.glob(frame_pattern))
-        
-        logger.info(f"Found {len(frame_files)} frames for {analysis_id}")
-        
-        # Skip the first 2 frames (often captured during scroll transition)
-        start_offset = 2
-        if len(frame_files) > start_offset:
-            frame_files = frame_files[start_offset:]
-        
-        # Select up to 5 representative frames (evenly spaced)
-        max_frames = 5
-        if len(frame_files) > max_frames:
-            # Select evenly spaced frames
-            step = len(frame_files) // max_frames
-            frame_files = [frame_files[i * step] for i in range(max_frames)]
+        all_frames, frame_files = get_frames(analysis_id)
         
-        # Read frame bytes
-        frame_bytes_list: List[bytes] = []
-        frames_base64: List[str] = []
+        logger.info("Found %s frames for %s", len(all_frames), analysis_id)
         
-        for frame_path in frame_files:
-            try:
-                with open(frame_path, 'rb') as f:
-                    frame_data = f.read()
-                    frame_bytes_list.append(frame_data)
-                    frames_base64.append(base64.b64encode(frame_data).decode('utf-8'))
-            except Exception as e:
-                logger.warning(f"Failed to read frame {frame_path}: {str(e)}")
-                continue
+        # Read and encode frames concurrently off the event loop
+        loop = asyncio.get_running_loop()
+        frames = await asyncio.gather(*(
+            loop.run_in_executor(None, read_frame, frame_path) for frame_path in frame_files
+        ))
+        frames = [frame for frame in frames if frame is not None]
+        frame_bytes_list = [frame_bytes for frame_bytes, _ in frames]
+        frames_base64 = [frame_base64 for _, frame_base64 in frames]
         
-        logger.info(f"Loaded {len(frame_bytes_list)} frames for Gemini analysis")
+        logger.info("Loaded %s frames for Gemini analysis", len(frame_bytes_list))
         
         # Get LessonGenerator and generate educational content
         generator = get_lesson_generator()
@@ -367,9 +632,9 @@ async def get_education(analysis_id: str = Path(..., description="Unique identif
             image_bytes_list=frame_bytes_list if frame_bytes_list else None
         )
         
-        logger.info(f"Generated educational content for {analysis_id}")
+        logger.info("Generated educational content for %s", analysis_id)
         
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "frames": frames_base64,
             "explanation": education.explanation,
             "indicators": education.indicators,
@@ -383,7 +648,7 @@ async def get_education(analysis_id: str = Path(..., description="Unique identif
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating education for {analysis_id}: {str(e)}", exc_info=True)
+        logger.error("Error generating education for %s: %s", analysis_id, e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate educational content: {str(e)}"
@@ -392,4 +657,5 @@ async def get_education(analysis_id: str = Path(..., description="Unique identif
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Result payloads are a few KB of JSON; per-message deflate costs more than it saves
+    uvicorn.run(app, host="0.0.0.0", port=8000, ws_per_message_deflate=False)
\ No newline at end of file
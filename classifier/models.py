@@ -7,7 +7,7 @@ Structured data classes for API responses and internal processing.
 from dataclasses import dataclass, field
 from typing import Dict, Any, List
 
-@dataclass
+@dataclass(slots=True)
 class DetectionResult:
     """
     Complete detection result combining ML classifier and intent analysis.
@@ -5,8 +5,9 @@ Processes 5 frames individually and combines results via voting and averaging.
 """
 
 from typing import List, TYPE_CHECKING
-from collections import Counter
+from collections import Counter, defaultdict
 import logging
+import numpy as np
 from models import DetectionResult
 
 if TYPE_CHECKING:
@@ -17,6 +18,14 @@ logger = logging.getLogger(__name__)
 class MultiFrameAnalyzer:
     """Processes multiple frames and combines results."""
     
+    # Tie-breaking priority when severity votes are split evenly
+    SEVERITY_PRIORITY = {"HIGH": 4, "MEDIUM": 3, "UNCERTAIN": 2, "LOW": 1}
+    
+    # Remaining frames are skipped when the first EARLY_EXIT_FRAMES all agree on
+    # HIGH severity with confidence above EARLY_EXIT_CONFIDENCE
+    EARLY_EXIT_FRAMES = 3
+    EARLY_EXIT_CONFIDENCE = 0.9
+    
     def __init__(self, detector: "AIImageDetector"):
         """
         Initialize multi-frame analyzer.
@@ -28,7 +37,7 @@ class MultiFrameAnalyzer:
     
     def analyze_frames(self, image_bytes_list: List[bytes]) -> DetectionResult:
         """
-        Process 5 frames individually and combine results.
+        Process 5 frames with batched classification and combine results.
         
         Args:
             image_bytes_list: List of 5 image bytes
@@ -39,29 +48,33 @@ class MultiFrameAnalyzer:
         if len(image_bytes_list) != 5:
             raise ValueError(f"Expected exactly 5 frames, but received {len(image_bytes_list)}")
         
-        logger.info(f"Processing {len(image_bytes_list)} frames individually...")
+        logger.info("Processing %s frames in batches...", len(image_bytes_list))
+        
+        # Classify the first frames in one batched forward pass; frames that fail are skipped
+        frame_results = self.detector.analyze_batch(image_bytes_list[:self.EARLY_EXIT_FRAMES])
         
-        # Process each frame individually
-        frame_results = []
-        for i, image_bytes in enumerate(image_bytes_list):
-            try:
-                result = self.detector.analyze(image_bytes)
-                frame_results.append(result)
-                logger.debug(f"Frame {i+1}/10: severity={result.severity}, confidence={result.confidence:.4f}")
-            except Exception as e:
-                logger.warning(f"Frame {i+1}/10 processing failed: {str(e)}", exc_info=True)
-                # Continue with other frames - we'll handle incomplete results
+        if self._is_unambiguous(frame_results):
+            logger.info("First %s frames agree on HIGH severity, skipping the rest", len(frame_results))
+        else:
+            frame_results += self.detector.analyze_batch(image_bytes_list[self.EARLY_EXIT_FRAMES:])
         
         if not frame_results:
             raise Exception("All frames failed to process")
         
-        logger.info(f"Successfully processed {len(frame_results)}/{len(image_bytes_list)} frames")
+        logger.info("Successfully processed %s/%s frames", len(frame_results), len(image_bytes_list))
         
         # Combine results
         combined = self._combine_results(frame_results)
         
         return combined
     
+    def _is_unambiguous(self, frame_results: List[DetectionResult]) -> bool:
+        """Check whether all early frames succeeded and agree on HIGH with high confidence."""
+        return len(frame_results) == self.EARLY_EXIT_FRAMES and all(
+            r.severity == "HIGH" and r.confidence > self.EARLY_EXIT_CONFIDENCE
+            for r in frame_results
+        )
+    
     def _combine_results(self, frame_results: List[DetectionResult]) -> DetectionResult:
         """
         Combine multiple DetectionResult objects via voting and averaging.
@@ -72,96 +85,80 @@ class MultiFrameAnalyzer:
         Returns:
             Combined DetectionResult
         """
-        # Voting: Collect severity levels and determine majority
-        severities = [r.severity for r in frame_results]
-        severity_counts = Counter(severities)
-        majority_severity = severity_counts.most_common(1)[0][0]
-        
-        # Tie-breaking order: HIGH > MEDIUM > UNCERTAIN > LOW
-        if len(severity_counts) > 1:
-            # Check if there's a tie at the top
-            most_common_count = severity_counts.most_common(1)[0][1]
-            ties = [sev for sev, count in severity_counts.items() if count == most_common_count]
-            if len(ties) > 1:
-                # Apply tie-breaking priority
-                priority = {"HIGH": 4, "MEDIUM": 3, "UNCERTAIN": 2, "LOW": 1}
-                majority_severity = max(ties, key=lambda s: priority.get(s, 0))
-        
-        # Average numeric scores
-        avg_confidence = sum(r.confidence for r in frame_results) / len(frame_results)
-        avg_aesthetic_similarity = sum(r.aesthetic_similarity_score for r in frame_results) / len(frame_results)
-        avg_signal_confidence = sum(r.signal_confidence for r in frame_results) / len(frame_results)
-        avg_context_loss_penalty = sum(r.context_loss_penalty for r in frame_results) / len(frame_results)
-        
-        # Vote on is_ai (majority)
-        ai_votes = sum(1 for r in frame_results if r.is_ai)
-        majority_is_ai = ai_votes > len(frame_results) / 2
-        
-        # Combine plausible_intents from all frames
-        all_intents = []
-        intent_likelihoods = {}  # Track max likelihood per intent type across frames
-        for result in frame_results:
+        # Voting: majority severity, ties broken by HIGH > MEDIUM > UNCERTAIN > LOW
+        severity_counts = Counter(r.severity for r in frame_results)
+        majority_severity = max(
+            severity_counts.items(),
+            key=lambda item: (item[1], self.SEVERITY_PRIORITY.get(item[0], 0))
+        )[0]
+        
+        # Average numeric scores in one vectorized reduction
+        # Columns: confidence, aesthetic similarity, signal confidence, context loss penalty, is_ai
+        frame_scores = np.array([
+            (r.confidence, r.aesthetic_similarity_score, r.signal_confidence,
+             r.context_loss_penalty, float(r.is_ai))
+            for r in frame_results
+        ], dtype=np.float64)
+        means = frame_scores.mean(axis=0)
+        avg_confidence = float(means[0])
+        avg_aesthetic_similarity = float(means[1])
+        avg_signal_confidence = float(means[2])
+        avg_context_loss_penalty = float(means[3])
+        
+        # Vote on is_ai (strict majority), read off the is_ai column mean
+        majority_is_ai = bool(means[4] > 0.5)
+        
+        # Combine plausible_intents from all frames: keep, per intent type, the entry
+        # from the frame with the maximum likelihood (earliest frame on ties)
+        intent_types = list(dict.fromkeys(
+            intent.get("intent", "other")
+            for result in frame_results
+            for intent in result.plausible_intents
+        ))
+        intent_columns = {intent_type: j for j, intent_type in enumerate(intent_types)}
+        # Likelihood matrix (frames x intent types); -inf where a frame lacks an intent
+        likelihood_matrix = np.full((len(frame_results), len(intent_types)), -np.inf)
+        intent_entries = {}
+        for i, result in enumerate(frame_results):
             for intent in result.plausible_intents:
-                intent_type = intent.get("intent", "other")
+                j = intent_columns[intent.get("intent", "other")]
                 likelihood = intent.get("likelihood", 0.0)
-                uncertainty = intent.get("uncertainty", 0.5)
-                
-                # Track maximum likelihood per intent type
-                if intent_type not in intent_likelihoods:
-                    intent_likelihoods[intent_type] = {
-                        "likelihood": likelihood,
-                        "uncertainty": uncertainty,
-                        "evidence": intent.get("evidence", [])
-                    }
-                else:
-                    if likelihood > intent_likelihoods[intent_type]["likelihood"]:
-                        intent_likelihoods[intent_type] = {
-                            "likelihood": likelihood,
-                            "uncertainty": uncertainty,
-                            "evidence": intent.get("evidence", [])
-                        }
-        
-        # Convert intent_likelihoods back to list format
-        combined_intents = [
-            {
+                if likelihood > likelihood_matrix[i, j]:
+                    likelihood_matrix[i, j] = likelihood
+                    intent_entries[i, j] = intent
+        best_frames = likelihood_matrix.argmax(axis=0)
+        
+        combined_intents = []
+        for j, (intent_type, i) in enumerate(zip(intent_types, best_frames)):
+            intent = intent_entries[int(i), j]
+            combined_intents.append({
                 "intent": intent_type,
-                "likelihood": round(data["likelihood"], 4),
-                "uncertainty": round(data["uncertainty"], 4),
-                "evidence": data["evidence"][:3]  # Limit evidence to top 3
-            }
-            for intent_type, data in intent_likelihoods.items()
-        ]
+                "likelihood": round(intent.get("likelihood", 0.0), 4),
+                "uncertainty": round(intent.get("uncertainty", 0.5), 4),
+                "evidence": intent.get("evidence", [])[:3]  # Limit evidence to top 3
+            })
         # Sort by likelihood descending
         combined_intents.sort(key=lambda x: x["likelihood"], reverse=True)
         
-        # Combine reasons (collect unique reasons from all frames)
-        all_reasons = []
-        seen_reasons = set()
+        # Combine reasons (collect unique reasons from all frames, keeping the
+        # first occurrence of each case-normalized reason in order)
+        unique_reasons = {}
         for result in frame_results:
             for reason in result.reasons:
-                # Normalize reason text for deduplication
-                reason_key = reason.lower().strip()
-                if reason_key not in seen_reasons:
-                    seen_reasons.add(reason_key)
-                    all_reasons.append(reason)
+                unique_reasons.setdefault(reason.strip().casefold(), reason)
         
         # Keep top reasons (limit to avoid overwhelming output)
-        combined_reasons = all_reasons[:10]  # Top 10 unique reasons
+        combined_reasons = list(unique_reasons.values())[:10]  # Top 10 unique reasons
         
         # Combine classifier_scores (average probabilities)
-        all_classifier_scores = {}
-        score_counts = {}
+        label_scores = defaultdict(list)
         for result in frame_results:
             for label, score in result.classifier_scores.items():
-                if label not in all_classifier_scores:
-                    all_classifier_scores[label] = 0.0
-                    score_counts[label] = 0
-                all_classifier_scores[label] += score
-                score_counts[label] += 1
+                label_scores[label].append(score)
         
         combined_classifier_scores = {
-            label: score / score_counts[label]
-            for label, score in all_classifier_scores.items()
+            label: float(np.mean(scores))
+            for label, scores in label_scores.items()
         }
         
         # Combine risk_factors (use first frame's structure, but could average if needed)
@@ -184,9 +181,8 @@ class MultiFrameAnalyzer:
             plausible_intents=combined_intents
         )
         
-        logger.info(f"Combined result: severity={majority_severity}, "
-                   f"confidence={avg_confidence:.4f}, "
-                   f"aesthetic_similarity={avg_aesthetic_similarity:.4f}")
+        logger.info("Combined result: severity=%s, confidence=%.4f, aesthetic_similarity=%.4f",
+                    majority_severity, avg_confidence, avg_aesthetic_similarity)
         
         return combined_result
 
@@ -5,14 +5,21 @@ Analyzes screenshot quality and degradation to assess signal reliability.
 All inputs are assumed to be TikTok video frame screenshots.
 """
 
+from bisect import bisect_left
 import cv2
 import numpy as np
 from PIL import Image
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 class ScreenshotAnalyzer:
     """Analyzes screenshot quality and artifacts to determine signal confidence."""
     
+    # Signal confidence penalty ladders: (thresholds, penalties); a score strictly
+    # above thresholds[k - 1] (and not above thresholds[k]) costs penalties[k]
+    COMPRESSION_PENALTIES = ((0.3, 0.5), (0.0, 0.1, 0.2))
+    EDGE_ALIASING_PENALTIES = ((0.4, 0.6), (0.0, 0.08, 0.15))
+    MOTION_BLUR_PENALTIES = ((0.5, 0.7), (0.0, 0.1, 0.2))
+    
     def __init__(self):
         """Initialize screenshot analyzer."""
         pass
@@ -34,55 +41,114 @@ class ScreenshotAnalyzer:
                 - artifact_levels: Dict with specific artifact scores
                 - capture_type: str (always "screen_grab")
         """
-        img_array = np.array(image.convert("RGB"))
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        height, width = img_array.shape[:2]
+        gray = self._prepare_gray(image)
         
         # Analyze artifacts
         compression_artifacts = self._detect_compression_artifacts(gray)
         edge_aliasing = self._detect_edge_aliasing(gray)
         motion_blur = self._detect_motion_blur(gray)
         
+        signal_confidence = self._signal_confidence(compression_artifacts, edge_aliasing, motion_blur)
+        
+        return self._build_result(
+            signal_confidence=round(signal_confidence, 4),
+            compression_artifacts=round(compression_artifacts, 4),
+            edge_aliasing=round(edge_aliasing, 4),
+            motion_blur=round(motion_blur, 4)
+        )
+    
+    def analyze_batch(self, images: List[Image.Image]) -> List[Dict[str, Any]]:
+        """
+        Analyze screenshot quality for several frames.
+        
+        Frames of the same size are stacked into one (N, H, W) array so the block
+        variance runs as a single vectorized reduction over all of them; edge
+        aliasing and motion blur still run per frame (OpenCV filters are 2-D).
+        
+        Args:
+            images: PIL Image objects (RGB format)
+        
+        Returns:
+            One analyze()-shaped dictionary per image, in input order
+        """
+        grays = [self._prepare_gray(image) for image in images]
+        
+        if len({gray.shape for gray in grays}) == 1:
+            compression_scores = self._compression_scores(np.stack(grays)).tolist()
+        else:
+            compression_scores = [self._detect_compression_artifacts(gray) for gray in grays]
+        
+        # Rows of (signal confidence, compression, edge aliasing, motion blur),
+        # rounded to 4 places in one vectorized call
+        scores = []
+        for gray, compression_artifacts in zip(grays, compression_scores):
+            edge_aliasing = self._detect_edge_aliasing(gray)
+            motion_blur = self._detect_motion_blur(gray)
+            signal_confidence = self._signal_confidence(compression_artifacts, edge_aliasing, motion_blur)
+            scores.append((signal_confidence, compression_artifacts, edge_aliasing, motion_blur))
+        
+        return [self._build_result(*row) for row in np.round(scores, 4).tolist()]
+    
+    def _prepare_gray(self, image: Image.Image) -> np.ndarray:
+        """
+        Convert an image to the full-resolution grayscale plane used by all metrics.
+        
+        The metrics are not scale-invariant (8x8 JPEG blocks, Laplacian variance and
+        gradient magnitude all depend on pixel size, and their thresholds are
+        calibrated at full resolution), so the image is not downsampled.
+        """
+        # Let PIL produce the luma plane directly, skipping any RGB array copy
+        return np.asarray(image.convert("L"))
+    
+    def _signal_confidence(
+        self,
+        compression_artifacts: float,
+        edge_aliasing: float,
+        motion_blur: float
+    ) -> float:
+        """Derive signal confidence (0.3-0.9) from artifact scores."""
         # Calculate signal confidence based on artifact levels
         # Lower artifacts = higher signal confidence
-        # Formula: start at 1.0, reduce for each artifact type
-        signal_confidence = 1.0
-        
-        # Compression artifacts reduce signal reliability
-        if compression_artifacts > 0.5:
-            signal_confidence -= 0.2
-        elif compression_artifacts > 0.3:
-            signal_confidence -= 0.1
-        
-        # Edge aliasing reduces geometry analysis reliability
-        if edge_aliasing > 0.6:
-            signal_confidence -= 0.15
-        elif edge_aliasing > 0.4:
-            signal_confidence -= 0.08
-        
-        # Motion blur reduces overall feature extraction reliability
-        if motion_blur > 0.7:
-            signal_confidence -= 0.2
-        elif motion_blur > 0.5:
-            signal_confidence -= 0.1
+        # Formula: start at 1.0, reduce for each artifact type:
+        # compression artifacts reduce signal reliability, edge aliasing reduces
+        # geometry analysis reliability, motion blur reduces overall feature
+        # extraction reliability
+        signal_confidence = (
+            1.0
+            - self._penalty(self.COMPRESSION_PENALTIES, compression_artifacts)
+            - self._penalty(self.EDGE_ALIASING_PENALTIES, edge_aliasing)
+            - self._penalty(self.MOTION_BLUR_PENALTIES, motion_blur)
+        )
         
         # Clamp to reasonable range (0.3 to 0.9)
         # Even worst screenshots have some signal, best have limitations
-        signal_confidence = max(0.3, min(0.9, signal_confidence))
-        
-        artifact_levels = {
-            "compression": round(compression_artifacts, 4),
-            "edge_aliasing": round(edge_aliasing, 4),
-            "motion_blur": round(motion_blur, 4)
-        }
-        
+        return max(0.3, min(0.9, signal_confidence))
+    
+    @staticmethod
+    def _build_result(
+        signal_confidence: float,
+        compression_artifacts: float,
+        edge_aliasing: float,
+        motion_blur: float
+    ) -> Dict[str, Any]:
+        """Assemble the analysis result from already rounded scores."""
         return {
             "screenshot_confidence": 1.0,  # Always a screenshot
-            "signal_confidence": round(signal_confidence, 4),
-            "artifact_levels": artifact_levels,
+            "signal_confidence": signal_confidence,
+            "artifact_levels": {
+                "compression": compression_artifacts,
+                "edge_aliasing": edge_aliasing,
+                "motion_blur": motion_blur
+            },
             "capture_type": "screen_grab"
         }
     
+    @staticmethod
+    def _penalty(ladder, score: float) -> float:
+        """Look up the signal confidence penalty for an artifact score."""
+        thresholds, penalties = ladder
+        return penalties[bisect_left(thresholds, score)]
+    
     def _detect_compression_artifacts(self, gray: np.ndarray) -> float:
         """
         Detect compression artifacts (double compression from TikTok + screenshot).
@@ -92,35 +158,57 @@ class ScreenshotAnalyzer:
         Returns:
             Compression artifact score (0-1), higher = more artifacts
         """
-        # Convert to float for DCT
-        img_float = gray.astype(np.float32)
+        return float(self._compression_scores(gray))
+    
+    def _compression_scores(self, grays: np.ndarray) -> np.ndarray:
+        """
+        Compute compression artifact scores for one (H, W) or several (N, H, W)
+        same-sized grayscale images.
         
+        Returns:
+            Array of scores (0-1) with the leading shape of grays
+        """
         # Analyze 8x8 blocks (JPEG compression block size)
         block_size = 8
-        height, width = img_float.shape
+        height, width = grays.shape[-2:]
+        leading_shape = grays.shape[:-2]
         
-        # Crop to multiple of block_size
-        h_crop = (height // block_size) * block_size
-        w_crop = (width // block_size) * block_size
-        img_cropped = img_float[:h_crop, :w_crop]
+        # Whole blocks per axis (the last block row and column are skipped)
+        rows = height // block_size - 1
+        cols = width // block_size - 1
+        if rows <= 0 or cols <= 0:
+            return np.zeros(leading_shape)
         
-        # Calculate block variance (compressed blocks have lower variance)
-        block_variances = []
-        for i in range(0, h_crop - block_size, block_size):
-            for j in range(0, w_crop - block_size, block_size):
-                block = img_cropped[i:i+block_size, j:j+block_size]
-                block_var = np.var(block)
-                block_variances.append(block_var)
+        # Summed-area tables of x and x^2 per image (float64 is exact for 8-bit
+        # pixels), sampled at the block corners
+        flat = grays.reshape(-1, height, width)
+        corner_rows = slice(0, rows * block_size + 1, block_size)
+        corner_cols = slice(0, cols * block_size + 1, block_size)
+        sum_corners = np.empty((len(flat), rows + 1, cols + 1))
+        square_corners = np.empty((len(flat), rows + 1, cols + 1))
+        for k, gray in enumerate(flat):
+            sums, square_sums = cv2.integral2(gray, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+            sum_corners[k] = sums[corner_rows, corner_cols]
+            square_corners[k] = square_sums[corner_rows, corner_cols]
+        sum_corners = sum_corners.reshape(*leading_shape, rows + 1, cols + 1)
+        square_corners = square_corners.reshape(*leading_shape, rows + 1, cols + 1)
         
-        if not block_variances:
-            return 0.0
+        # Every block variance at once as E[x^2] - E[x]^2:
+        # n^2 * var = n * sum(x^2) - sum(x)^2
+        n = block_size * block_size
+        block_sums = self._block_totals(sum_corners)
+        scaled_variances = n * self._block_totals(square_corners) - block_sums * block_sums
         
         # Low variance blocks suggest compression artifacts
-        avg_variance = np.mean(block_variances)
+        avg_variance = scaled_variances.mean(axis=(-2, -1)) / (n * n)
         # Normalize: very low variance (< 100) indicates compression
-        artifact_score = max(0.0, min(1.0, (100 - avg_variance) / 100.0))
-        
-        return artifact_score
+        return np.clip((100 - avg_variance) / 100.0, 0.0, 1.0)
+    
+    @staticmethod
+    def _block_totals(corners: np.ndarray) -> np.ndarray:
+        """Per-block totals from summed-area table values sampled at block corners."""
+        return (corners[..., 1:, 1:] - corners[..., :-1, 1:]
+                - corners[..., 1:, :-1] + corners[..., :-1, :-1])
     
     def _detect_edge_aliasing(self, gray: np.ndarray) -> float:
         """
@@ -129,22 +217,30 @@ class ScreenshotAnalyzer:
         Returns:
             Aliasing score (0-1), higher = more aliasing
         """
-        # Use Canny edge detection
+        # Use Canny edge detection (on the image itself: Canny's internal Sobel
+        # handles borders differently from spatialGradient, so feeding it the
+        # derivatives below would change the detected edges)
         edges = cv2.Canny(gray, 50, 150)
         
         # Count edge pixels
-        edge_pixels = np.sum(edges > 0)
+        edge_pixels = cv2.countNonZero(edges)
         total_pixels = edges.size
         edge_density = edge_pixels / total_pixels if total_pixels > 0 else 0.0
         
+        # At this density the score below clamps to 1.0 whatever the gradient is
+        if edge_density >= 0.2:
+            return 1.0
+        
         # High edge density with sharp transitions suggests aliasing
-        # Calculate edge sharpness using gradient magnitude
-        grad_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-        grad_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-        gradient_magnitude = np.sqrt(grad_x**2 + grad_y**2)
+        # Calculate edge sharpness using mean gradient magnitude, estimated from
+        # int16 3x3 Sobel derivatives (one spatialGradient call) as mean |Gx| + |Gy|
+        # (L1 norms, no float buffers); for isotropic gradients
+        # E[|Gx| + |Gy|] = (4 / pi) * E[magnitude]
+        grad_x, grad_y = cv2.spatialGradient(gray, ksize=3)
+        l1_gradient = cv2.norm(grad_x, cv2.NORM_L1) + cv2.norm(grad_y, cv2.NORM_L1)
         
         # High gradient magnitude + high edge density = aliasing
-        avg_gradient = np.mean(gradient_magnitude)
+        avg_gradient = l1_gradient / grad_x.size * (np.pi / 4)
         
         # Normalize (high values indicate aliasing)
         aliasing_score = min(1.0, (edge_density * 10 + avg_gradient / 50) / 2.0)
@@ -160,8 +256,11 @@ class ScreenshotAnalyzer:
         Returns:
             Motion blur score (0-1), higher = more blur
         """
-        # Calculate Laplacian variance
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+        # Calculate Laplacian variance (int16 is exact for 8-bit input with the
+        # default aperture; meanStdDev reduces it without a float64 copy)
+        laplacian = cv2.Laplacian(gray, cv2.CV_16S)
+        _, stddev = cv2.meanStdDev(laplacian)
+        laplacian_var = float(stddev[0, 0]) ** 2
         
         # Sharp images typically have variance > 500
         # Very blurred images have variance < 100
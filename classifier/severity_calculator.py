@@ -15,6 +15,9 @@ class SeverityCalculator:
     HIGH_SEVERITY_THRESHOLD = 0.7
     MEDIUM_SEVERITY_THRESHOLD = 0.4
     
+    # Severity by how many of the base thresholds (MEDIUM, HIGH) are reached
+    _BASE_SEVERITY_LEVELS = ("LOW", "MEDIUM", "MEDIUM")
+    
     # Risk score multipliers based on content type
     CONTENT_TYPE_MULTIPLIERS = {
         "portrait": 1.2,    # Portraits are riskier (catfishing)
@@ -25,6 +28,16 @@ class SeverityCalculator:
         "other": 1.0
     }
     
+    # Intent types whose likelihood counts as deception
+    DECEPTIVE_INTENTS = frozenset({"impersonation", "promotion"})
+    
+    # Limitations every reason list leads with (decontextualized screenshot analysis)
+    _LIMITATION_PREAMBLE = (
+        "Based on a single TikTok video frame screenshot (no UI elements)...",
+        "Without platform context or temporal information...",
+        "This assessment may change with additional context."
+    )
+    
     def calculate(
         self,
         classifier_result: Dict[str, Any],
@@ -51,8 +64,10 @@ class SeverityCalculator:
             DetectionResult with severity, reasons, and all analysis data
         """
         classifier_scores = classifier_result.get("scores", {})
+        raw_confidence = classifier_result.get("confidence", 0.0)
         content_type = intent_analysis.get("content_type", "other")
         deception_indicators = intent_analysis.get("deception_indicators", [])
+        indicator_count = len(deception_indicators)
         risk_factors = intent_analysis.get("risk_factors", {})
         style = intent_analysis.get("style", "mixed")
         context_loss_penalty = context_loss_result.get("context_loss_penalty", 0.3)
@@ -69,18 +84,18 @@ class SeverityCalculator:
         
         # Apply context loss penalty to confidence
         # Cap confidence at max_achievable_confidence
-        raw_confidence = classifier_result.get("confidence", 0.0)
         confidence = min(raw_confidence, max_achievable_confidence)
         
         # SDXL CAP #2: Aesthetic similarity contributes max 20% to severity
         # Get deception likelihood from plausible_intents
-        deception_likelihood = 0.0
-        for intent in plausible_intents:
-            if intent.get("intent") in ["impersonation", "promotion"]:
-                deception_likelihood = max(deception_likelihood, intent.get("likelihood", 0.0))
+        deception_likelihood = max(
+            (intent.get("likelihood", 0.0) for intent in plausible_intents
+             if intent.get("intent") in self.DECEPTIVE_INTENTS),
+            default=0.0
+        )
         
         # Count deception indicators as additional signal
-        deception_strength = min(len(deception_indicators) / 5.0, 1.0)  # Normalize to 0-1
+        deception_strength = min(indicator_count / 5.0, 1.0)  # Normalize to 0-1
         
         # Severity calculation: SDXL max 20%, intent/deception 50%, other 30%
         base_severity = (
@@ -100,25 +115,23 @@ class SeverityCalculator:
         # 3. Human identity implied (face present)
         strong_ai_similarity = aesthetic_similarity_score > 0.7
         strong_deception = (
-            len(deception_indicators) >= 2 or 
+            indicator_count >= 2 or 
             deception_likelihood > 0.6 or
             deception_strength > 0.5
         )
         
-        # Determine severity level
+        # Determine severity level from the number of base thresholds reached
+        # (high base severity without all three criteria is still only MEDIUM)
+        severity = self._BASE_SEVERITY_LEVELS[
+            (base_severity >= self.MEDIUM_SEVERITY_THRESHOLD)
+            + (base_severity >= self.HIGH_SEVERITY_THRESHOLD)
+        ]
         if strong_ai_similarity and strong_deception and has_human_identity:
             # All three criteria met - HIGH severity
             severity = "HIGH"
-        elif base_severity >= self.HIGH_SEVERITY_THRESHOLD:
-            # High base severity but missing one criterion - MEDIUM
-            severity = "MEDIUM"
-        elif base_severity >= self.MEDIUM_SEVERITY_THRESHOLD:
-            severity = "MEDIUM"
-        elif confidence < 0.5 or context_loss_penalty > 0.6:
+        elif severity == "LOW" and (confidence < 0.5 or context_loss_penalty > 0.6):
             # High context loss or low confidence - UNCERTAIN
             severity = "UNCERTAIN"
-        else:
-            severity = "LOW"
         
         # Generate human-readable reasons (always lead with limitations)
         reasons = self._generate_reasons(
@@ -140,7 +153,7 @@ class SeverityCalculator:
             "style": style,
             "adjusted_severity": round(base_severity, 4),
             "factors": risk_factors,
-            "deception_indicator_count": len(deception_indicators),
+            "deception_indicator_count": indicator_count,
             "deception_likelihood": round(deception_likelihood, 4),
             "strong_ai_similarity": strong_ai_similarity,
             "strong_deception": strong_deception,
@@ -179,12 +192,8 @@ class SeverityCalculator:
         
         ALWAYS leads with limitations about decontextualized screenshot analysis.
         """
-        reasons = []
-        
         # ALWAYS START WITH LIMITATIONS (Step 9 from reframing)
-        reasons.append("Based on a single TikTok video frame screenshot (no UI elements)...")
-        reasons.append("Without platform context or temporal information...")
-        reasons.append("This assessment may change with additional context.")
+        reasons = list(self._LIMITATION_PREAMBLE)
         
         # Add blank line (will be handled as separate string)
         
@@ -235,7 +244,7 @@ class SeverityCalculator:
                 reasons.append("Low confidence due to conflicting or insufficient signals - assessment is uncertain.")
         
         # Ensure we have at least the limitation statements
-        if len(reasons) <= 3:
+        if len(reasons) <= len(self._LIMITATION_PREAMBLE):
             reasons.append("Insufficient evidence for definitive classification.")
         
         return reasons
@@ -9,7 +9,11 @@ Usage:
 Tests the OCR functionality from VisualAnalyzer on a single image.
 """
 
+import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pytesseract
 from PIL import Image
 from visual_analyzer import VisualAnalyzer
@@ -23,6 +27,61 @@ def check_tesseract():
     except Exception:
         return False
 
+def run_psm(analyzer: VisualAnalyzer, image: np.ndarray, psm: int):
+    """Run OCR with one page segmentation mode and return (words, confidences)."""
+    # Goes through the analyzer's OCR cache, so the full analysis below reuses
+    # the PSM 11 result instead of running OCR again
+    ocr_data = analyzer._run_ocr(image, psm)
+    
+    words = []
+    confidences = []
+    for i in range(len(ocr_data['text'])):
+        text = ocr_data['text'][i].strip()
+        conf = int(ocr_data['conf'][i])
+        if text and conf > -1:
+            words.append(text)
+            confidences.append(conf)
+    
+    return words, confidences
+
+def ocr_pages(images):
+    """
+    OCR several images with a single tesseract invocation.
+    
+    The images are written to a temporary directory and passed to tesseract as a
+    list file, so the engine and language model are loaded once for all of them.
+    
+    Returns:
+        One image_to_data-style dict per image (same order), with "text" and "conf" lists
+    """
+    pages = [{"text": [], "conf": [], "line": []} for _ in images]
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        list_path = os.path.join(tmp_dir, "list.txt")
+        with open(list_path, "w") as list_file:
+            for i, image in enumerate(images):
+                page_path = os.path.join(tmp_dir, f"page{i}.png")
+                image.save(page_path)
+                list_file.write(page_path + "\n")
+        
+        ocr_data = pytesseract.image_to_data(list_path, output_type=pytesseract.Output.DICT)
+    
+    for i, page_num in enumerate(ocr_data['page_num']):
+        page = pages[int(page_num) - 1]
+        page["text"].append(ocr_data['text'][i])
+        page["conf"].append(ocr_data['conf'][i])
+        page["line"].append((ocr_data['block_num'][i], ocr_data['par_num'][i], ocr_data['line_num'][i]))
+    
+    return pages
+
+def page_text(page) -> str:
+    """Rebuild plain text from word-level OCR data (one output line per text line)."""
+    lines = {}
+    for text, line in zip(page["text"], page["line"]):
+        if text.strip():
+            lines.setdefault(line, []).append(text.strip())
+    return "\n".join(" ".join(words) for words in lines.values())
+
 def test_ocr(image_path: str):
     """Test OCR on a single image with detailed debugging."""
     # Check tesseract first
@@ -44,18 +103,36 @@ def test_ocr(image_path: str):
         print(f"✗ Failed to load image: {e}")
         return
     
-    # Initialize analyzer
+    # Initialize analyzer; it works on the grayscale image
     analyzer = VisualAnalyzer()
+    gray = np.asarray(image.convert("L"))
+    
+    # Preprocess up front so the original and preprocessed images can be OCR'd
+    # in one batched tesseract run
+    preprocessed = None
+    preprocess_error = None
+    try:
+        preprocessed = analyzer._preprocess_for_ocr(gray)
+    except Exception as e:
+        preprocess_error = e
+    
+    pages = None
+    batch_error = None
+    try:
+        pages = ocr_pages([image] if preprocessed is None else [image, Image.fromarray(preprocessed)])
+    except Exception as e:
+        batch_error = e
     
     # Test pytesseract directly first
     print("\n" + "=" * 60)
     print("DIRECT PYTESSERACT TEST (no preprocessing):")
     print("=" * 60)
     try:
-        raw_text = pytesseract.image_to_string(image)
-        print(f"Raw text (image_to_string): '{raw_text.strip()}'")
+        if batch_error is not None:
+            raise batch_error
+        raw_data = pages[0]
+        print(f"Raw text: '{page_text(raw_data)}'")
         
-        raw_data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
         raw_words = [t for t in raw_data['text'] if t.strip()]
         print(f"Raw words found: {len(raw_words)}")
         if raw_words:
@@ -69,27 +146,28 @@ def test_ocr(image_path: str):
     print("\n" + "=" * 60)
     print("PREPROCESSING TEST:")
     print("=" * 60)
-    preprocessed = None
     try:
-        preprocessed = analyzer._preprocess_for_ocr(image)
-        print(f"Preprocessed size: {preprocessed.size[0]}x{preprocessed.size[1]}")
+        if preprocess_error is not None:
+            raise preprocess_error
+        print(f"Preprocessed size: {preprocessed.shape[1]}x{preprocessed.shape[0]}")
         print(f"Original size: {image.size[0]}x{image.size[1]}")
-        upscaled = preprocessed.size[0] > image.size[0] or preprocessed.size[1] > image.size[1]
+        upscaled = preprocessed.shape[1] > image.size[0] or preprocessed.shape[0] > image.size[1]
         print(f"Upscaled: {upscaled}")
         
         # Save preprocessed image for inspection
         try:
-            preprocessed.save('test_preprocessed.jpg')
+            Image.fromarray(preprocessed).save('test_preprocessed.jpg')
             print("✓ Saved preprocessed image to: test_preprocessed.jpg")
         except Exception as save_error:
             print(f"⚠ Could not save preprocessed image: {save_error}")
         
         # Test pytesseract on preprocessed
         try:
-            preprocessed_text = pytesseract.image_to_string(preprocessed)
-            print(f"\nPreprocessed text (image_to_string): '{preprocessed_text.strip()}'")
+            if batch_error is not None:
+                raise batch_error
+            preprocessed_data = pages[1]
+            print(f"\nPreprocessed text: '{page_text(preprocessed_data)}'")
             
-            preprocessed_data = pytesseract.image_to_data(preprocessed, output_type=pytesseract.Output.DICT)
             preprocessed_words = [t for t in preprocessed_data['text'] if t.strip()]
             print(f"Preprocessed words found: {len(preprocessed_words)}")
             if preprocessed_words:
@@ -101,7 +179,7 @@ def test_ocr(image_path: str):
         import traceback
         traceback.print_exc()
     
-    if not preprocessed:
+    if preprocessed is None:
         print("⚠ Skipping PSM mode tests (preprocessing failed)")
         return
     
@@ -112,19 +190,14 @@ def test_ocr(image_path: str):
     psm_modes = [11, 6, 7, 8, 13]
     psm_names = {11: "Sparse text", 6: "Uniform block", 7: "Single line", 8: "Single word", 13: "Raw line"}
     
+    # Without tesserocr each mode runs in its own tesseract process, so the sweep
+    # runs concurrently
+    with ThreadPoolExecutor(max_workers=len(psm_modes)) as executor:
+        futures = {psm: executor.submit(run_psm, analyzer, preprocessed, psm) for psm in psm_modes}
+    
     for psm in psm_modes:
         try:
-            config = f'--psm {psm}'
-            ocr_data = pytesseract.image_to_data(preprocessed, config=config, output_type=pytesseract.Output.DICT)
-            
-            words = []
-            confidences = []
-            for i in range(len(ocr_data['text'])):
-                text = ocr_data['text'][i].strip()
-                conf = int(ocr_data['conf'][i])
-                if text and conf > -1:
-                    words.append(text)
-                    confidences.append(conf)
+            words, confidences = futures[psm].result()
             
             print(f"PSM {psm} ({psm_names.get(psm, 'Unknown')}): {len(words)} words found")
             if words:
@@ -139,7 +212,7 @@ def test_ocr(image_path: str):
     print("FULL OCR ANALYSIS (VisualAnalyzer):")
     print("=" * 60)
     try:
-        text_result = analyzer._analyze_text(image)
+        text_result = analyzer._analyze_text(gray)
         
         print(f"Text found: '{text_result.get('text_found', '')}'")
         print(f"Word count: {text_result.get('word_count', 0)}")
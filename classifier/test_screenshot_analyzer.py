@@ -0,0 +1,86 @@
+"""
+Regression tests for ScreenshotAnalyzer scores.
+
+Run with: python -m pytest test_screenshot_analyzer.py
+"""
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from screenshot_analyzer import ScreenshotAnalyzer
+
+
+def blurred_frame(width: int = 1080, height: int = 1920) -> Image.Image:
+    """A portrait video frame: random texture with a heavy Gaussian blur."""
+    rng = np.random.default_rng(0)
+    texture = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    return Image.fromarray(cv2.GaussianBlur(texture, (0, 0), 3.0))
+
+
+def baseline_scores(image: Image.Image):
+    """Motion blur and signal confidence as computed by the original full-resolution analyzer."""
+    gray = cv2.cvtColor(np.array(image.convert("RGB")), cv2.COLOR_RGB2GRAY)
+
+    laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+    if laplacian_var > 500:
+        motion_blur = 0.0
+    elif laplacian_var < 100:
+        motion_blur = 1.0
+    else:
+        motion_blur = 1.0 - (laplacian_var - 100) / 400.0
+
+    edges = cv2.Canny(gray, 50, 150)
+    edge_density = np.sum(edges > 0) / edges.size
+    grad_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
+    grad_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
+    avg_gradient = np.mean(np.sqrt(grad_x**2 + grad_y**2))
+    edge_aliasing = min(1.0, (edge_density * 10 + avg_gradient / 50) / 2.0)
+
+    h_crop, w_crop = (gray.shape[0] // 8) * 8, (gray.shape[1] // 8) * 8
+    block_variances = [
+        np.var(gray[i:i+8, j:j+8].astype(np.float32))
+        for i in range(0, h_crop - 8, 8)
+        for j in range(0, w_crop - 8, 8)
+    ]
+    compression = max(0.0, min(1.0, (100 - np.mean(block_variances)) / 100.0))
+
+    signal_confidence = 1.0
+    if compression > 0.5:
+        signal_confidence -= 0.2
+    elif compression > 0.3:
+        signal_confidence -= 0.1
+    if edge_aliasing > 0.6:
+        signal_confidence -= 0.15
+    elif edge_aliasing > 0.4:
+        signal_confidence -= 0.08
+    if motion_blur > 0.7:
+        signal_confidence -= 0.2
+    elif motion_blur > 0.5:
+        signal_confidence -= 0.1
+    signal_confidence = max(0.3, min(0.9, signal_confidence))
+
+    return round(motion_blur, 4), round(signal_confidence, 4)
+
+
+@pytest.fixture(scope="module")
+def analyzer():
+    return ScreenshotAnalyzer()
+
+
+def test_blurred_frame_matches_baseline(analyzer):
+    image = blurred_frame()
+    motion_blur, signal_confidence = baseline_scores(image)
+
+    result = analyzer.analyze(image)
+
+    assert motion_blur > 0.7  # The frame really is blurry
+    assert result["artifact_levels"]["motion_blur"] == pytest.approx(motion_blur, abs=0.01)
+    assert result["signal_confidence"] == pytest.approx(signal_confidence)
+
+
+def test_batch_matches_single_frame(analyzer):
+    image = blurred_frame()
+
+    assert analyzer.analyze_batch([image, image]) == [analyzer.analyze(image)] * 2
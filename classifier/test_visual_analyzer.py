@@ -0,0 +1,57 @@
+"""
+Tests for VisualAnalyzer's OCR gating.
+
+Run with: python -m pytest test_visual_analyzer.py
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from visual_analyzer import VisualAnalyzer
+
+
+def smooth_background(width: int = 1080, height: int = 1920) -> np.ndarray:
+    """A blurred vertical gradient, like an out-of-focus video background."""
+    column = np.linspace(40, 200, height, dtype=np.float32)
+    gray = np.repeat(column[:, None], width, axis=1).astype(np.uint8)
+    return cv2.GaussianBlur(gray, (0, 0), 5.0)
+
+
+def caption_frame(text: str = "FREE GIFT CARD") -> np.ndarray:
+    """One line of large caption text over a smooth background."""
+    gray = smooth_background()
+    cv2.putText(gray, text, (140, 1500), cv2.FONT_HERSHEY_SIMPLEX, 2.5, 255, 6, cv2.LINE_AA)
+    return gray
+
+
+@pytest.fixture
+def ocr_calls():
+    """A VisualAnalyzer whose OCR engine is replaced by a recorder."""
+    analyzer = VisualAnalyzer()
+    calls = []
+
+    def fake_run_ocr(image, psm):
+        calls.append(psm)
+        return {"text": [], "conf": [], "left": [], "top": [], "width": [], "height": []}
+
+    analyzer._run_ocr = fake_run_ocr
+    yield analyzer, calls
+    analyzer.close()
+
+
+def test_single_caption_line_reaches_ocr(ocr_calls):
+    analyzer, calls = ocr_calls
+
+    analyzer._analyze_text(caption_frame())
+
+    assert calls == [11]
+
+
+def test_flat_frame_skips_ocr(ocr_calls):
+    analyzer, calls = ocr_calls
+
+    result = analyzer._analyze_text(smooth_background())
+
+    assert calls == []
+    assert result["word_count"] == 0
@@ -6,21 +6,176 @@ Includes face detection, OCR, and metadata analysis.
 """
 
 import cv2
+import hashlib
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 import pytesseract
 import re
-from typing import Dict, Any, List, Tuple
+from cachetools import LRUCache
+from typing import Dict, Any, List, Optional, Tuple
+
+# tesserocr (optional) keeps one Tesseract engine loaded in-process; without it,
+# OCR falls back to pytesseract, which spawns a tesseract process per call.
+# Frames are already OCR'd in parallel, so Tesseract's own OpenMP threading is
+# limited to one thread (read when the library loads and by each subprocess)
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
+logger = logging.getLogger(__name__)
+
+# Gibberish heuristics: runs of 5+ identical characters, and a bytes.translate table
+# classifying ASCII as letter (b'a'), whitespace (b' ') or other (b'.') the same
+# way str.isalpha / str.isspace do
+_REPEAT_RE = re.compile(r'(.)\1{4,}')
+_ASCII_CLASSES = bytes(
+    0x61 if chr(i).isalpha() else 0x20 if chr(i).isspace() else 0x2E
+    for i in range(256)
+)
+
+# Optional YuNet face detector model (ONNX); Haar cascade is used when it is absent
+YUNET_MODEL_PATH = os.getenv(
+    "YUNET_MODEL_PATH",
+    os.path.join(os.path.dirname(__file__), "models", "face_detection_yunet_2023mar_int8.onnx")
+)
+
+def _to_device(gray: np.ndarray):
+    """Wrap an image as a cv2.UMat when OpenCL is enabled, so OpenCV runs it on the GPU."""
+    return cv2.UMat(gray) if cv2.ocl.useOpenCL() else gray
+
+# Frames analyzed concurrently by VisualAnalyzer.analyze_batch (multi-frame
+# requests carry at most 5 frames)
+BATCH_WORKERS = min(5, os.cpu_count() or 1)
+
+# Keep OpenCV's SIMD dispatch on; its internal thread pool keeps the default size,
+# since single-frame requests (the live path) rely on it
+cv2.setUseOptimized(True)
+
+# Pool for the OCR stage of analyze() (one task per frame in flight), created on
+# first use; Tesseract and the OpenCV filters release the GIL, so OCR overlaps
+# with face detection in the calling thread
+analysis_executor: Optional[ThreadPoolExecutor] = None
+_analysis_executor_lock = threading.Lock()
+
+def get_analysis_executor() -> ThreadPoolExecutor:
+    """Get or create the OCR thread pool."""
+    global analysis_executor
+    with _analysis_executor_lock:
+        if analysis_executor is None:
+            analysis_executor = ThreadPoolExecutor(
+                max_workers=BATCH_WORKERS, thread_name_prefix="visual-analysis"
+            )
+    return analysis_executor
+
+# Pool for analyze_batch, created on the first batch; each worker thread owns a
+# VisualAnalyzer (built when the thread starts), since the face detectors and the
+# OCR engine must not be shared between concurrent analyses
+_batch_worker = threading.local()
+batch_executor: Optional[ThreadPoolExecutor] = None
+_batch_executor_lock = threading.Lock()
+
+def _init_batch_worker():
+    """Create the calling worker thread's VisualAnalyzer."""
+    _batch_worker.analyzer = VisualAnalyzer()
+
+def _analyze_in_worker(image: Image.Image) -> Dict[str, Any]:
+    """Analyze one frame with the worker thread's VisualAnalyzer."""
+    return _batch_worker.analyzer.analyze(image)
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    """Get or create the analyze_batch thread pool."""
+    global batch_executor
+    with _batch_executor_lock:
+        if batch_executor is None:
+            batch_executor = ThreadPoolExecutor(
+                max_workers=BATCH_WORKERS,
+                thread_name_prefix="visual-batch",
+                initializer=_init_batch_worker
+            )
+    return batch_executor
 
 class VisualAnalyzer:
     """Analyzes images to extract visual features for intent detection and risk scoring."""
     
+    # Images above FACE_DETECTION_MAX_PIXELS are downscaled for YuNet detection so
+    # their longest side is FACE_DETECTION_MAX_SIDE
+    FACE_DETECTION_MAX_PIXELS = 1_500_000
+    FACE_DETECTION_MAX_SIDE = 1280
+    
+    # The Haar cascade always searches a copy whose longest side is at most
+    # HAAR_MAX_SIDE; faces in these frames stay well above its minimum window
+    HAAR_MAX_SIDE = 640
+    
+    # Sharpness of images at least SHARPNESS_PATCH_SIZE * SHARPNESS_PATCH_GRID on
+    # both sides is sampled from an evenly spaced grid of patches
+    SHARPNESS_PATCH_SIZE = 256
+    SHARPNESS_PATCH_GRID = 3
+    
+    # OCR is skipped when fewer than this fraction of pixels are Canny edges. One
+    # line of large caption text on a plain 1080x1920 frame is ~0.35%, so only
+    # near-edgeless frames (flat backgrounds, smooth portraits) fall below it
+    OCR_MIN_EDGE_FRACTION = 0.0008
+    
+    # Perspective (Hough line) analysis needs a longest side of PERSPECTIVE_MIN_SIDE
+    # and a Laplacian variance of PERSPECTIVE_MIN_LAPLACIAN_VAR, and runs on a copy
+    # whose longest side is at most PERSPECTIVE_MAX_SIDE
+    PERSPECTIVE_MIN_SIDE = 480
+    PERSPECTIVE_MIN_LAPLACIAN_VAR = 50
+    PERSPECTIVE_MAX_SIDE = 640
+    
+    # OCR preprocessing skips the unsharp mask at or above this Laplacian variance,
+    # and upscales small images bilinearly (not bicubically) above the second one
+    OCR_SHARPEN_MAX_LAPLACIAN_VAR = 200
+    OCR_LINEAR_UPSCALE_MIN_LAPLACIAN_VAR = 300
+    
     def __init__(self):
-        """Initialize face detection model."""
-        # Initialize OpenCV Haar Cascade face detector
+        """Initialize face detection model and OCR engine."""
+        # OpenCV Haar Cascade face detector; it keeps per-scan state, so each
+        # analyzer owns one
         self.face_cascade = cv2.CascadeClassifier(
             cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
         )
+        
+        # YuNet face detector (single CNN pass instead of a sliding-window pyramid),
+        # if its model file is available
+        self.face_detector = None
+        if os.path.exists(YUNET_MODEL_PATH) and hasattr(cv2, "FaceDetectorYN"):
+            try:
+                self.face_detector = cv2.FaceDetectorYN.create(
+                    YUNET_MODEL_PATH, "", (320, 320), score_threshold=0.6
+                )
+            except cv2.error as e:
+                logger.warning("YuNet face detector unavailable, using Haar cascade: %s", e)
+        
+        # Persistent Tesseract engine (PSM 11: sparse text), if tesserocr is installed
+        self.tess_api = None
+        if PyTessBaseAPI is not None:
+            try:
+                self.tess_api = PyTessBaseAPI(psm=11)
+            except RuntimeError as e:
+                logger.warning("tesserocr unavailable, falling back to pytesseract: %s", e)
+    
+        # CLAHE operator for OCR preprocessing, built once and reused per frame
+        self.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        
+        # OCR results keyed by image content hash, shape and PSM, so repeated
+        # OCR of the same preprocessed image is served from memory
+        self._ocr_cache: LRUCache = LRUCache(maxsize=64)
+        self._ocr_cache_lock = threading.Lock()
+        # The tesserocr engine is not thread-safe
+        self._tess_lock = threading.Lock()
+    
+    def close(self):
+        """Release the persistent Tesseract engine, if any."""
+        if self.tess_api is not None:
+            self.tess_api.End()
+            self.tess_api = None
     
     def analyze(self, image: Image.Image) -> Dict[str, Any]:
         """
@@ -37,24 +192,107 @@ class VisualAnalyzer:
                 "metadata": {...}
             }
         """
-        img_array = np.array(image.convert("RGB"))
+        # Grayscale is decoded straight to luminance once and shared; the RGB
+        # array (a view, without copying RGB images) is only needed for YuNet
+        gray = np.asarray(image.convert("L"))
+        img_array = None
+        if self.face_detector is not None:
+            rgb_image = image if image.mode == "RGB" else image.convert("RGB")
+            img_array = np.asarray(rgb_image)
+        # Sharpness feeds both the metadata quality score and OCR preprocessing
+        laplacian_var = self._laplacian_variance(gray)
+        
+        # OCR (the slowest stage) runs on the pool while faces are detected here,
+        # once, for both face and semantic analysis (the detectors must not be
+        # used from several threads at once)
+        text_future = get_analysis_executor().submit(self._analyze_text, gray, laplacian_var)
+        faces = self._detect_faces(gray, img_array)
+        semantic_errors = self._analyze_semantic_errors(gray, faces, image.size, laplacian_var)
         
         results = {
-            "faces": self._analyze_faces(img_array, image.size),
-            "text": self._analyze_text(image),
-            "metadata": self._analyze_metadata(image, img_array),
-            "semantic_errors": self._analyze_semantic_errors(img_array, image.size)
+            "faces": self._analyze_faces(faces, image.size),
+            "text": text_future.result(),
+            "metadata": self._analyze_metadata(image, laplacian_var),
+            "semantic_errors": semantic_errors
         }
         
         return results
     
+    def analyze_batch(self, images: List[Image.Image]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run analyze() on several frames concurrently.
+        
+        Frames are spread over the batch pool (see get_batch_executor), whose worker
+        threads each hold their own VisualAnalyzer.
+        
+        Returns:
+            One analyze() result per image, in input order; None for frames whose
+            analysis failed
+        """
+        executor = get_batch_executor()
+        futures = [executor.submit(_analyze_in_worker, image) for image in images]
+        results = []
+        for i, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning("Visual analysis of frame %s/%s failed: %s", i + 1, len(images), e)
+                results.append(None)
+        return results
+    
+    def _detect_faces(self, gray: np.ndarray, img_array: Optional[np.ndarray]) -> np.ndarray:
+        """
+        Detect faces with YuNet when available, otherwise the Haar cascade.
+        
+        img_array is the RGB image, required only when YuNet is in use.
+        
+        Returns:
+            Array of (x, y, w, h) face boxes in pixels
+        """
+        # Detection cost is linear in pixels, so large images are searched on a
+        # downscaled working copy
+        height, width = gray.shape[:2]
+        scale = 1.0
+        
+        if self.face_detector is None:
+            # Haar: cap the longest side at HAAR_MAX_SIDE and equalize the histogram
+            # to normalize contrast before the scan
+            if max(width, height) > self.HAAR_MAX_SIDE:
+                scale = self.HAAR_MAX_SIDE / max(width, height)
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_LINEAR)
+            gray = cv2.equalizeHist(gray)
+            # 40px minimum face at full resolution, mapped onto the working copy;
+            # Canny pruning skips flat regions (old-format cascades)
+            min_side = max(1, round(40 * scale))
+            faces = self.face_cascade.detectMultiScale(
+                _to_device(gray),
+                scaleFactor=1.2,
+                minNeighbors=3,
+                flags=cv2.CASCADE_DO_CANNY_PRUNING | cv2.CASCADE_SCALE_IMAGE,
+                minSize=(min_side, min_side)
+            )
+            boxes = np.asarray(faces, dtype=np.float64).reshape(-1, 4)
+        else:
+            # YuNet: downscale only images above FACE_DETECTION_MAX_PIXELS
+            if width * height > self.FACE_DETECTION_MAX_PIXELS:
+                scale = self.FACE_DETECTION_MAX_SIDE / max(width, height)
+                img_array = cv2.resize(img_array, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            small_height, small_width = img_array.shape[:2]
+            self.face_detector.setInputSize((small_width, small_height))
+            _, faces = self.face_detector.detect(cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR))
+            # Rows are bbox (4), five landmarks (10) and score; keep the bbox
+            boxes = np.empty((0, 4)) if faces is None else faces[:, :4].astype(np.float64)
+        
+        # Map boxes back to full-resolution pixels
+        return np.rint(boxes / scale).astype(np.int32)
+    
     def _analyze_faces(
         self, 
-        img_array: np.ndarray, 
+        faces: np.ndarray,
         image_size: Tuple[int, int]
     ) -> Dict[str, Any]:
         """
-        Detect and analyze faces in the image using OpenCV Haar Cascade.
+        Analyze the faces found by _detect_faces.
         
         Returns:
             {
@@ -66,53 +304,29 @@ class VisualAnalyzer:
         """
         width, height = image_size
         
-        # Convert to grayscale for face detection
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        face_count = len(faces)
         
-        # Detect faces
-        faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=1.1,
-            minNeighbors=5,
-            minSize=(30, 30)
-        )
+        # Normalize all boxes (0-1) at once: columns x, y, w, h
+        boxes = np.asarray(faces, dtype=np.float64).reshape(-1, 4)
+        norm_boxes = boxes / np.array([width, height, width, height], dtype=np.float64)
+        sizes = norm_boxes[:, 2:]
         
-        face_count = len(faces)
-        face_locations = []
-        face_qualities = []
-        is_centered = False
-        
-        for (x, y, w, h) in faces:
-            # Normalize coordinates (0-1)
-            norm_x = x / width
-            norm_y = y / height
-            norm_w = w / width
-            norm_h = h / height
-            
-            # Calculate center coordinates (normalized)
-            center_x = norm_x + norm_w / 2
-            center_y = norm_y + norm_h / 2
-            
-            face_locations.append({
-                "x": float(center_x),
-                "y": float(center_y),
-                "width": float(norm_w),
-                "height": float(norm_h)
-            })
-            
-            # Calculate face quality (size-based heuristic)
-            face_area = norm_w * norm_h
-            face_qualities.append(face_area)
-            
-            # Check if face is centered (within 30% of image center)
-            center_threshold = 0.3
-            is_centered = (
-                abs(center_x - 0.5) < center_threshold and
-                abs(center_y - 0.5) < center_threshold
-            )
+        # Calculate center coordinates (normalized)
+        centers = norm_boxes[:, :2] + sizes / 2
+        
+        face_locations = [
+            {"x": center_x, "y": center_y, "width": norm_w, "height": norm_h}
+            for (center_x, center_y), (norm_w, norm_h) in zip(centers.tolist(), sizes.tolist())
+        ]
+        
+        # Face quality (size-based heuristic): average normalized face area
+        face_areas = sizes[:, 0] * sizes[:, 1]
+        face_quality = float(face_areas.mean()) if face_count else 0.0
         
-        # Average face quality
-        face_quality = float(np.mean(face_qualities)) if face_qualities else 0.0
+        # Faces centered within 30% of the image center
+        center_threshold = 0.3
+        centered = (np.abs(centers - 0.5) < center_threshold).all(axis=1)
+        is_centered = bool(centered.any())
         
         # Determine if portrait (centered face, takes significant portion of image)
         is_portrait = bool(
@@ -129,47 +343,51 @@ class VisualAnalyzer:
             "face_locations": face_locations
         }
     
-    def _preprocess_for_ocr(self, image: Image.Image) -> Image.Image:
+    def _preprocess_for_ocr(self, gray: np.ndarray, laplacian_var: Optional[float] = None) -> np.ndarray:
         """
-        Preprocess image for better OCR results on TikTok screenshots.
+        Preprocess a grayscale image for better OCR results on TikTok screenshots.
         
-        Applies: upscaling, grayscale conversion, denoising, contrast enhancement, sharpening.
+        Applies: upscaling, denoising, contrast enhancement, and sharpening unless
+        laplacian_var shows the image is already sharp.
+        
+        Returns:
+            Preprocessed 8-bit grayscale array, ready for _run_ocr
         """
-        # Convert to numpy array
-        img_array = np.array(image.convert("RGB"))
-        original_height = img_array.shape[0]
+        original_height = gray.shape[0]
         
-        # Upscale if small (helps with small text in video frames)
+        # Upscale if small (helps with small text in video frames); already sharp
+        # images get the cheaper bilinear kernel instead of bicubic
         if original_height < 300:
             scale_factor = 2.0
-            img_array = cv2.resize(
-                img_array, None, 
+            sharp = laplacian_var is not None and laplacian_var > self.OCR_LINEAR_UPSCALE_MIN_LAPLACIAN_VAR
+            gray = cv2.resize(
+                gray, None, 
                 fx=scale_factor, fy=scale_factor, 
-                interpolation=cv2.INTER_CUBIC
+                interpolation=cv2.INTER_LINEAR if sharp else cv2.INTER_CUBIC
             )
         
-        # Convert to grayscale (often better for OCR than color)
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        
-        # Denoise (bilateral filter preserves edges while removing noise)
-        denoised = cv2.bilateralFilter(gray, 9, 75, 75)
+        # Denoise (3x3 median removes compression speckle and keeps text edges at a
+        # fraction of the cost of a bilateral filter)
+        denoised = cv2.medianBlur(gray, 3)
         
         # CLAHE contrast enhancement (helps with compressed video frames)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(denoised)
+        enhanced = self.clahe.apply(denoised)
         
-        # Sharpening (unsharp mask) - helps with video compression blur
+        # Sharpening (unsharp mask) - helps with video compression blur; skipped
+        # for images that are already sharp
+        if laplacian_var is not None and laplacian_var >= self.OCR_SHARPEN_MAX_LAPLACIAN_VAR:
+            return enhanced
         gaussian = cv2.GaussianBlur(enhanced, (0, 0), 2.0)
-        sharpened = cv2.addWeighted(enhanced, 1.5, gaussian, -0.5, 0)
-        
-        # Convert back to PIL Image
-        return Image.fromarray(sharpened)
+        return cv2.addWeighted(enhanced, 1.5, gaussian, -0.5, 0)
     
-    def _analyze_text(self, image: Image.Image) -> Dict[str, Any]:
+    def _analyze_text(self, gray: np.ndarray, laplacian_var: Optional[float] = None) -> Dict[str, Any]:
         """
-        Extract text from image using OCR with preprocessing and multiple PSM modes.
+        Extract text from image using OCR (PSM 11, sparse text) with preprocessing.
         
         Optimized for TikTok video frame screenshots with degraded text quality.
+        OCR is skipped if the Canny edge fraction of the grayscale image is below
+        OCR_MIN_EDGE_FRACTION (no text-like content); laplacian_var, if given, is
+        passed on to _preprocess_for_ocr.
         
         Returns:
             {
@@ -180,66 +398,66 @@ class VisualAnalyzer:
                 "ocr_confidence": float  # Average confidence from successful detections
             }
         """
+        # A single Canny pass is far cheaper than Tesseract; near-edgeless images
+        # (portraits, flat backgrounds) have no text worth recognizing
+        edge_fraction = cv2.countNonZero(cv2.Canny(gray, 100, 200)) / gray.size
+        if edge_fraction < self.OCR_MIN_EDGE_FRACTION:
+            return {
+                "text_found": "",
+                "is_gibberish": False,
+                "text_locations": [],
+                "word_count": 0,
+                "ocr_confidence": 0.0
+            }
+        
         # Preprocess image for better OCR
-        preprocessed = self._preprocess_for_ocr(image)
+        preprocessed = self._preprocess_for_ocr(gray, laplacian_var)
         
-        # Use single PSM mode for speed (was 5 modes: [11, 6, 7, 8, 13])
-        # PSM 11: Sparse text - find as much text as possible in any orientation
-        psm_modes = [11]  # Single mode for fast analysis
-        all_text_parts = []
-        all_locations = []
-        all_confidences = []
+        # Unique text entries keyed by position (first detection wins), in order
+        locations_by_position = {}
         
-        for psm in psm_modes:
-            try:
-                config = f'--psm {psm}'
-                ocr_data = pytesseract.image_to_data(
-                    preprocessed, 
-                    config=config, 
-                    output_type=pytesseract.Output.DICT
-                )
-                
-                # Extract text from this PSM mode
-                n_boxes = len(ocr_data['text'])
-                for i in range(n_boxes):
-                    text = ocr_data['text'][i].strip()
-                    conf = int(ocr_data['conf'][i])
-                    
-                    # Lower threshold for screenshots (video frames have degraded text)
-                    # Accept confidence > -1 (all detections, even low confidence)
-                    if text and conf > -1:
-                        # Store unique text entries (deduplicate by position)
-                        text_location_key = (
-                            ocr_data['left'][i] if ocr_data['left'][i] != -1 else -1,
-                            ocr_data['top'][i] if ocr_data['top'][i] != -1 else -1
-                        )
-                        
-                        # Check if we already have text at this location
-                        existing = next(
-                            (loc for loc in all_locations 
-                             if loc.get('x') == text_location_key[0] and 
-                                loc.get('y') == text_location_key[1]),
-                            None
-                        )
-                        
-                        if not existing and text_location_key[0] != -1:
-                            all_text_parts.append(text)
-                            all_confidences.append(conf)
-                            
-                            all_locations.append({
-                                "text": text,
-                                "x": ocr_data['left'][i],
-                                "y": ocr_data['top'][i],
-                                "width": ocr_data['width'][i],
-                                "height": ocr_data['height'][i],
-                                "confidence": conf
-                            })
-            except Exception:
-                # Continue with next PSM mode if one fails
-                continue
+        try:
+            # Single OCR pass with PSM 11 (sparse text: find as much text as
+            # possible in any orientation)
+            ocr_data = self._run_ocr(preprocessed, 11)
+            
+            # Decode confidences and boxes once as arrays instead of per word
+            # (pytesseract may hand back confidences as numeric strings)
+            texts = [t.strip() for t in ocr_data['text']]
+            confs = np.asarray(ocr_data['conf'], dtype=np.float64).astype(np.int32)
+            lefts = np.asarray(ocr_data['left'], dtype=np.int32)
+            
+            # Lower threshold for screenshots (video frames have degraded text)
+            # Accept confidence > -1 (all detections, even low confidence)
+            has_text = np.fromiter((bool(t) for t in texts), dtype=bool, count=len(texts))
+            kept = np.flatnonzero(has_text & (confs > -1) & (lefts != -1))
+            
+            kept_confs = confs[kept].tolist()
+            kept_lefts = lefts[kept].tolist()
+            kept_tops = np.asarray(ocr_data['top'], dtype=np.int32)[kept].tolist()
+            kept_widths = np.asarray(ocr_data['width'], dtype=np.int32)[kept].tolist()
+            kept_heights = np.asarray(ocr_data['height'], dtype=np.int32)[kept].tolist()
+            
+            for i, conf, x, y, w, h in zip(
+                kept.tolist(), kept_confs, kept_lefts, kept_tops, kept_widths, kept_heights
+            ):
+                if (x, y) not in locations_by_position:
+                    locations_by_position[x, y] = {
+                        "text": texts[i],
+                        "x": x,
+                        "y": y,
+                        "width": w,
+                        "height": h,
+                        "confidence": conf
+                    }
+        except Exception as e:
+            logger.warning("OCR failed: %s", e)
+        
+        all_locations = list(locations_by_position.values())
+        all_text_parts = [loc["text"] for loc in all_locations]
         
         # Calculate average OCR confidence (only from positive confidence detections)
-        positive_confs = [c for c in all_confidences if c > 0]
+        positive_confs = [loc["confidence"] for loc in all_locations if loc["confidence"] > 0]
         ocr_confidence = float(np.mean(positive_confs)) / 100.0 if positive_confs else 0.0
         
         # Combine all detected text
@@ -257,6 +475,68 @@ class VisualAnalyzer:
             "ocr_confidence": round(ocr_confidence, 4)
         }
     
+    def _run_ocr(self, image: np.ndarray, psm: int) -> Dict[str, List[Any]]:
+        """
+        Run word-level OCR on an 8-bit grayscale image, memoized on its content.
+        
+        Uses the persistent tesserocr engine when available, otherwise pytesseract.
+        The returned dictionary may be shared with other callers; do not mutate it.
+        
+        Returns:
+            Dictionary shaped like pytesseract.image_to_data(output_type=DICT):
+            parallel lists under "text", "conf", "left", "top", "width", "height"
+        """
+        image = np.ascontiguousarray(image)
+        key = (
+            hashlib.blake2b(image, digest_size=16).digest(),
+            image.shape,
+            psm
+        )
+        with self._ocr_cache_lock:
+            ocr_data = self._ocr_cache.get(key)
+        if ocr_data is not None:
+            return ocr_data
+        
+        if self.tess_api is None:
+            ocr_data = pytesseract.image_to_data(
+                image,
+                config=f'--psm {psm}',
+                output_type=pytesseract.Output.DICT
+            )
+        else:
+            with self._tess_lock:
+                ocr_data = self._run_tesserocr(image, psm)
+        
+        with self._ocr_cache_lock:
+            self._ocr_cache[key] = ocr_data
+        return ocr_data
+    
+    def _run_tesserocr(self, image: np.ndarray, psm: int) -> Dict[str, List[Any]]:
+        """Run word-level OCR on the persistent tesserocr engine (caller holds _tess_lock)."""
+        ocr_data = {"text": [], "conf": [], "left": [], "top": [], "width": [], "height": []}
+        
+        self.tess_api.SetPageSegMode(psm)
+        height, width = image.shape
+        self.tess_api.SetImageBytes(image.tobytes(), width, height, 1, width)
+        self.tess_api.Recognize()
+        iterator = self.tess_api.GetIterator()
+        if iterator is None:
+            return ocr_data
+        
+        for word in iterate_level(iterator, RIL.WORD):
+            box = word.BoundingBox(RIL.WORD)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            ocr_data["text"].append(word.GetUTF8Text(RIL.WORD) or "")
+            ocr_data["conf"].append(word.Confidence(RIL.WORD))
+            ocr_data["left"].append(x1)
+            ocr_data["top"].append(y1)
+            ocr_data["width"].append(x2 - x1)
+            ocr_data["height"].append(y2 - y1)
+        
+        return ocr_data
+    
     def _detect_gibberish(self, text: str) -> bool:
         """
         Detect if text appears to be gibberish/garbled.
@@ -271,12 +551,17 @@ class VisualAnalyzer:
             return False
         
         # Check for excessive repeating characters (more than 4 in a row)
-        if re.search(r'(.)\1{4,}', text):
+        if _REPEAT_RE.search(text):
             return True
         
-        # Check ratio of alphabetic characters to total
-        alpha_count = sum(c.isalpha() for c in text)
-        total_chars = len([c for c in text if not c.isspace()])
+        # Check ratio of alphabetic characters to total (one translate pass for ASCII text)
+        if text.isascii():
+            classes = text.encode('ascii').translate(_ASCII_CLASSES)
+            alpha_count = classes.count(b'a')
+            total_chars = len(classes) - classes.count(b' ')
+        else:
+            alpha_count = sum(c.isalpha() for c in text)
+            total_chars = sum(not c.isspace() for c in text)
         
         if total_chars > 0:
             alpha_ratio = alpha_count / total_chars
@@ -287,9 +572,9 @@ class VisualAnalyzer:
         # Check for unusual word patterns
         words = text.split()
         if len(words) > 5:
-            word_lengths = [len(w) for w in words if w.isalnum()]
-            if word_lengths:
-                avg_length = np.mean(word_lengths)
+            word_lengths = np.fromiter((len(w) for w in words if w.isalnum()), dtype=np.int64)
+            if word_lengths.size:
+                avg_length = word_lengths.mean()
                 # Very short average (likely nonsense) or very long (might be garbled)
                 if avg_length < 2.5 or avg_length > 15:
                     return True
@@ -299,11 +584,13 @@ class VisualAnalyzer:
     def _analyze_metadata(
         self, 
         image: Image.Image, 
-        img_array: np.ndarray
+        laplacian_var: float
     ) -> Dict[str, Any]:
         """
         Analyze basic image properties and quality metrics.
         
+        laplacian_var is the sharpness estimate from _laplacian_variance.
+        
         Returns:
             {
                 "width": int,
@@ -323,8 +610,6 @@ class VisualAnalyzer:
         resolution_score = min(total_pixels / (1920 * 1080), 1.0)  # Normalize to 1080p
         
         # Simple sharpness estimate using Laplacian variance
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
         # Normalize sharpness (very sharp images might have variance > 1000)
         sharpness_score = min(laplacian_var / 500.0, 1.0)
         
@@ -346,16 +631,44 @@ class VisualAnalyzer:
             "has_compression_artifacts": bool(has_compression_artifacts)
         }
     
+    def _laplacian_variance(self, gray: np.ndarray) -> float:
+        """
+        Variance of the Laplacian of an 8-bit grayscale image.
+        
+        The 3x3 Laplacian of uint8 input fits in int16, so it is computed in
+        CV_16S (a quarter of the bytes of CV_64F) with identical results. Large
+        images are estimated from a grid of SHARPNESS_PATCH_GRID² patches of
+        SHARPNESS_PATCH_SIZE pixels instead of the whole frame.
+        """
+        height, width = gray.shape[:2]
+        patch = self.SHARPNESS_PATCH_SIZE
+        grid = self.SHARPNESS_PATCH_GRID
+        if min(height, width) >= patch * grid:
+            ys = np.linspace(0, height - patch, grid, dtype=int)
+            xs = np.linspace(0, width - patch, grid, dtype=int)
+            # Filter each patch on its own so patch seams don't register as edges
+            laplacian = np.vstack([
+                cv2.Laplacian(gray[y:y + patch, x:x + patch], cv2.CV_16S)
+                for y in ys for x in xs
+            ])
+        else:
+            laplacian = cv2.Laplacian(_to_device(gray), cv2.CV_16S)
+        _, stddev = cv2.meanStdDev(laplacian)
+        return float(stddev[0, 0]) ** 2
+    
     def _analyze_semantic_errors(
         self,
-        img_array: np.ndarray,
-        image_size: Tuple[int, int]
+        gray: np.ndarray,
+        faces: np.ndarray,
+        image_size: Tuple[int, int],
+        laplacian_var: float
     ) -> Dict[str, Any]:
         """
         Analyze semantic errors in the image (geometry-based, screenshot-resilient).
         
         Focuses on anatomical inconsistencies, perspective violations, lighting issues,
-        and spatial relationships rather than texture patterns.
+        and spatial relationships rather than texture patterns. The line analysis for
+        perspective violations is skipped on small or very blurry images.
         
         Returns:
             {
@@ -368,7 +681,6 @@ class VisualAnalyzer:
             }
         """
         width, height = image_size
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
         
         # Initialize scores
         anatomical_score = 0.0
@@ -377,39 +689,52 @@ class VisualAnalyzer:
         spatial_score = 0.0
         text_warping_score = 0.0
         
-        # 1. Anatomical inconsistencies (face geometry)
-        faces = self.face_cascade.detectMultiScale(
-            gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
+        # 1. Anatomical inconsistencies (face geometry of the detected faces)
+        # Simple heuristic: check face proportions
+        # Real faces typically have width/height ratio around 0.6-0.8
+        boxes = np.asarray(faces, dtype=np.float64).reshape(-1, 4)
+        face_widths, face_heights = boxes[:, 2], boxes[:, 3]
+        face_ratios = np.divide(
+            face_widths, face_heights,
+            out=np.ones_like(face_widths), where=face_heights > 0
         )
+        # If ratio is extreme, might indicate distortion
+        distorted_faces = int(np.count_nonzero((face_ratios < 0.4) | (face_ratios > 1.2)))
         
-        if len(faces) > 0:
-            # Simple heuristic: check face proportions
-            # Real faces typically have width/height ratio around 0.6-0.8
-            for (x, y, w, h) in faces:
-                face_ratio = w / h if h > 0 else 1.0
-                # If ratio is extreme, might indicate distortion
-                if face_ratio < 0.4 or face_ratio > 1.2:
-                    anatomical_score += 0.3
-        
-        anatomical_score = min(anatomical_score, 1.0)
+        anatomical_score = min(0.3 * distorted_faces, 1.0)
         
         # 2. Perspective violations (vanishing point analysis)
-        # Simple check: use edge detection to find strong lines
-        edges = cv2.Canny(gray, 50, 150)
-        lines = cv2.HoughLinesP(edges, 1, np.pi/180, threshold=100, minLineLength=50, maxLineGap=10)
+        # Simple check: use edge detection to find strong lines. Small or blurry
+        # frames have too few reliable lines, and larger ones are searched at
+        # PERSPECTIVE_MAX_SIDE with the Hough lengths scaled to match (only the
+        # angles are used, which don't depend on scale)
+        lines = None
+        if (max(width, height) >= self.PERSPECTIVE_MIN_SIDE
+                and laplacian_var >= self.PERSPECTIVE_MIN_LAPLACIAN_VAR):
+            scale = min(1.0, self.PERSPECTIVE_MAX_SIDE / max(width, height))
+            line_gray = gray
+            if scale < 1.0:
+                line_gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            edges = cv2.Canny(line_gray, 50, 150)
+            lines = cv2.HoughLinesP(
+                edges, 1, np.pi/180,
+                threshold=max(1, round(100 * scale)),
+                minLineLength=50 * scale,
+                maxLineGap=10 * scale
+            )
         
         if lines is not None and len(lines) > 5:
             # Check if lines converge to reasonable vanishing points
             # Too many parallel lines in wrong directions might indicate issues
-            angles = []
-            for line in lines:
-                x1, y1, x2, y2 = line[0]
-                angle = np.arctan2(y2 - y1, x2 - x1) * 180 / np.pi
-                angles.append(angle)
+            segments = lines.reshape(-1, 4).astype(np.float64)
+            angles = np.degrees(np.arctan2(
+                segments[:, 3] - segments[:, 1],
+                segments[:, 2] - segments[:, 0]
+            ))
             
             # If angles are too uniform or too chaotic, might indicate errors
-            if len(angles) > 0:
-                angle_variance = np.var(angles)
+            if angles.size > 0:
+                angle_variance = float(angles.var())
                 if angle_variance < 100:  # Too uniform (unlikely in real scenes)
                     perspective_score = 0.3
                 elif angle_variance > 5000:  # Too chaotic (might indicate artifacts)